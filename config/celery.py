@@ -34,6 +34,10 @@ app.conf.beat_schedule = {
         'task': 'documents.tasks.escalate_overdue_approvals',
         'schedule': 86400.0,  # Every 24 hours
     },
+    'hash-pending-document-files-hourly': {
+        'task': 'documents.tasks.hash_pending_document_files',
+        'schedule': 3600.0,  # Every hour
+    },
 }
 
 @app.task(bind=True)
@@ -22,6 +22,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third-party
     'rest_framework',
     'rest_framework_simplejwt',
@@ -158,7 +159,7 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
 }
@@ -210,6 +211,11 @@ LOGGING = {
 
 # File upload settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB
+# Hash uploads while they stream in so saving them needs no second read
+FILE_UPLOAD_HANDLERS = [
+    'core.hashing.HashingMemoryFileUploadHandler',
+    'core.hashing.HashingTemporaryFileUploadHandler',
+]
 DATA_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024
 
 # Production Security Settings
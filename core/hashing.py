@@ -0,0 +1,90 @@
+"""
+SHA-256 hashing of stored and uploaded files for integrity verification.
+"""
+import hashlib
+
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+# Read size for storages whose file objects cannot be handed to
+# hashlib.file_digest. Large reads amortise the per-update() overhead and
+# let OpenSSL hash long contiguous buffers with the GIL released.
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def sha256_file(file):
+    """
+    Return a sha256 hash object over the full contents of ``file``.
+
+    ``file`` is a Django File/FieldFile. It is opened if necessary and left
+    closed or rewound to the start afterwards, as it was found.
+    """
+    was_closed = file.closed
+    file.open('rb')
+    try:
+        file.seek(0)
+        try:
+            # Read/update loop runs in C
+            return hashlib.file_digest(file, 'sha256')
+        except ValueError:
+            # Not a readinto()-capable binary file (some remote storages)
+            file.seek(0)
+            digest = hashlib.sha256()
+            for chunk in file.chunks(chunk_size=HASH_CHUNK_SIZE):
+                digest.update(chunk)
+            return digest
+    finally:
+        if was_closed:
+            file.close()
+        else:
+            file.seek(0)
+
+
+def uploaded_sha256(field_file):
+    """
+    Return the raw SHA-256 digest recorded while ``field_file`` was uploaded.
+
+    Only files that arrived through the hashing upload handlers in this
+    request carry one; for anything else (including files already in
+    storage, which are not opened) this returns None.
+    """
+    upload = getattr(field_file, '_file', None)
+    return getattr(upload, 'sha256_digest', None)
+
+
+class HashingMemoryFileUploadHandler(MemoryFileUploadHandler):
+    """In-memory upload handler that hashes chunks as they stream in."""
+
+    def new_file(self, *args, **kwargs):
+        self._sha256 = hashlib.sha256() if self.activated else None
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        if self._sha256 is not None:
+            self._sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        upload = super().file_complete(file_size)
+        if upload is not None:
+            upload.sha256_digest = self._sha256.digest()
+        return upload
+
+
+class HashingTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    """Temporary-file upload handler that hashes chunks as they stream in."""
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self._sha256 = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self._sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        upload = super().file_complete(file_size)
+        upload.sha256_digest = self._sha256.digest()
+        return upload
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_notification'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('approval_request', 'Approval Request'), ('approval_complete', 'Approval Complete'), ('capa_assignment', 'CAPA Assignment'), ('deviation_alert', 'Deviation Alert'), ('overdue_reminder', 'Overdue Reminder'), ('training_reminder', 'Training Reminder'), ('review_overdue', 'Review Overdue'), ('review_reminder', 'Review Reminder'), ('approval_escalation', 'Approval Escalation')], db_index=True, max_length=30),
+        ),
+    ]
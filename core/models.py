@@ -9,6 +9,8 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 
+from core.hashing import sha256_file, uploaded_sha256
+
 
 class Notification(models.Model):
     """
@@ -22,6 +24,9 @@ class Notification(models.Model):
         ('deviation_alert', 'Deviation Alert'),
         ('overdue_reminder', 'Overdue Reminder'),
         ('training_reminder', 'Training Reminder'),
+        ('review_overdue', 'Review Overdue'),
+        ('review_reminder', 'Review Reminder'),
+        ('approval_escalation', 'Approval Escalation'),
     ]
 
     recipient = models.ForeignKey(
@@ -106,10 +111,10 @@ class Attachment(models.Model):
 
     def compute_hash(self):
         """Compute SHA-256 hash for file integrity verification."""
-        sha256 = hashlib.sha256()
-        for chunk in self.file.chunks():
-            sha256.update(chunk)
-        return sha256.hexdigest()
+        uploaded_digest = uploaded_sha256(self.file)
+        if uploaded_digest is not None:
+            return uploaded_digest.hex()
+        return sha256_file(self.file).hexdigest()
 
     def save(self, *args, **kwargs):
         if self.file and not self.file_hash:
@@ -4,6 +4,8 @@ Handles email notifications for approvals, CAPAs, deviations, and reminders.
 Also creates in-app Notification records for the notification center.
 """
 import logging
+from itertools import islice
+
 from django.core.mail import send_mail
 from django.conf import settings
 from django.template.loader import render_to_string
@@ -18,21 +20,55 @@ class NotificationService:
     FRONTEND_BASE_URL = getattr(settings, 'FRONTEND_URL', 'http://localhost:3000')
 
     @staticmethod
-    def _create_in_app_notification(recipient, notification_type, subject, message,
-                                     related_object_type='', related_object_id=''):
+    def build_in_app_notification(recipient, notification_type, subject, message,
+                                  related_object_type='', related_object_id=''):
+        """
+        Return an unsaved in-app Notification, for callers that insert many
+        at once through create_in_app_notifications(). ``recipient`` may be
+        a User or a user primary key.
+        """
+        from core.models import Notification
+        recipient_key = 'recipient_id' if isinstance(recipient, int) else 'recipient'
+        return Notification(
+            **{recipient_key: recipient},
+            notification_type=notification_type,
+            subject=subject,
+            message=message,
+            related_object_type=related_object_type,
+            related_object_id=str(related_object_id) if related_object_id else '',
+        )
+
+    @staticmethod
+    def create_in_app_notifications(notifications, batch_size=500):
+        """
+        Insert unsaved Notification records, ``batch_size`` per INSERT.
+
+        ``notifications`` may be any iterable and is consumed one batch at
+        a time, so a generator over a queryset iterator keeps memory
+        bounded. A failing batch is logged and skipped. Returns the number
+        created.
+        """
+        from core.models import Notification
+        created = 0
+        notifications = iter(notifications)
+        while batch := list(islice(notifications, batch_size)):
+            try:
+                created += len(Notification.objects.bulk_create(batch))
+            except Exception as e:
+                logger.error(f"Failed to create {len(batch)} in-app notifications: {e}")
+        return created
+
+    @classmethod
+    def _create_in_app_notification(cls, recipient, notification_type, subject, message,
+                                    related_object_type='', related_object_id=''):
         """
         Create an in-app Notification record so users see it in the notification center.
         """
         try:
-            from core.models import Notification
-            Notification.objects.create(
-                recipient=recipient,
-                notification_type=notification_type,
-                subject=subject,
-                message=message,
-                related_object_type=related_object_type,
-                related_object_id=str(related_object_id) if related_object_id else '',
-            )
+            cls.build_in_app_notification(
+                recipient, notification_type, subject, message,
+                related_object_type, related_object_id,
+            ).save()
         except Exception as e:
             logger.error(f"Failed to create in-app notification for {recipient}: {e}")
 
@@ -100,6 +100,82 @@ def log_save(sender, instance, created, **kwargs):
         logger.error(f"Audit log failed: {e}")
 
 
+def log_bulk_create(sender, instances):
+    """
+    Write create entries for ``instances`` inserted with bulk_create().
+
+    bulk_create() sends no post_save, so bulk paths call this to keep the
+    audit trail complete. Entries match those written by log_save().
+    """
+    user = get_current_user()
+    if not user or not user.is_authenticated or not issubclass(sender, AuditedModel):
+        return
+
+    ct = ContentType.objects.get_for_model(sender)
+    ip_address = get_current_ip()
+    entries = [
+        AuditLog(
+            content_type=ct,
+            object_id=str(instance.pk),
+            object_repr=str(instance)[:255],
+            user=user,
+            action='create',
+            ip_address=ip_address,
+            old_values={},
+            new_values={
+                f.name: str(getattr(instance, f.name))
+                for f in sender._meta.fields
+                if f.name not in ('updated_at',)
+            },
+            change_summary=f"Created {sender.__name__}: {instance}",
+        )
+        for instance in instances
+    ]
+    AuditLog.objects.bulk_create(entries, batch_size=1000)
+    logger.info(f"Audit: bulk create {len(entries)} {sender.__name__} by {user}")
+
+
+def audit_values(instance, fields):
+    """Values of ``fields`` on ``instance`` as log_save() records them."""
+    return {name: str(getattr(instance, name)) for name in fields}
+
+
+def log_bulk_update(sender, instances, fields):
+    """
+    Write update entries for ``instances`` saved with bulk_update().
+
+    bulk_update() sends no signals, so callers record each instance's
+    ``_old_values`` with audit_values() before changing it. Only ``fields``
+    are compared and recorded; unchanged instances get no entry.
+    """
+    user = get_current_user()
+    if not user or not user.is_authenticated or not issubclass(sender, AuditedModel):
+        return
+
+    ct = ContentType.objects.get_for_model(sender)
+    ip_address = get_current_ip()
+    entries = []
+    for instance in instances:
+        old_values = getattr(instance, '_old_values', {})
+        new_values = audit_values(instance, fields)
+        changes = {k: v for k, v in new_values.items() if old_values.get(k) != v}
+        if not changes:
+            continue
+        entries.append(AuditLog(
+            content_type=ct,
+            object_id=str(instance.pk),
+            object_repr=str(instance)[:255],
+            user=user,
+            action='update',
+            ip_address=ip_address,
+            old_values=old_values,
+            new_values=new_values,
+            change_summary='; '.join(f"{k}: {old_values.get(k, '')} → {v}" for k, v in changes.items()),
+        ))
+    AuditLog.objects.bulk_create(entries, batch_size=1000)
+    logger.info(f"Audit: bulk update {len(entries)} {sender.__name__} by {user}")
+
+
 @receiver(post_delete)
 def log_delete(sender, instance, **kwargs):
     """Log deletion to audit trail."""
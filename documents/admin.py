@@ -72,7 +72,14 @@ class DocumentChangeApprovalAdmin(admin.ModelAdmin):
 
 @admin.register(Document)
 class DocumentAdmin(admin.ModelAdmin):
-    list_display = ('document_id', 'title', 'vault_state', 'created_at')
+    list_display = ('document_id', 'title', 'vault_state', 'approvals', 'created_at')
     list_filter = ('vault_state', 'created_at')
     search_fields = ('document_id', 'title', 'description')
     ordering = ['-created_at']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_approval_counts()
+
+    @admin.display(description='Approvals', ordering='approved_count')
+    def approvals(self, obj):
+        return f'{obj.approved_count}/{obj.total_approvers}'
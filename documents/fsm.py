@@ -5,7 +5,10 @@ Defines valid state transitions for the 9-state document lifecycle:
 Draft → In Review → Approved → Training Period → Effective → Superseded/Obsolete/Archived
                                                            → Cancelled (from draft/in_review)
 """
+from typing import NamedTuple
+
 from django.core.exceptions import ValidationError
+from django.db.models import prefetch_related_objects
 
 # Valid state transitions map
 VALID_TRANSITIONS = {
@@ -21,6 +24,9 @@ VALID_TRANSITIONS = {
     'cancelled': [],  # terminal state
 }
 
+# States with no outgoing transitions
+_TERMINAL_STATES = frozenset({'archived', 'cancelled'})
+
 # Permissions required for each transition
 TRANSITION_PERMISSIONS = {
     ('draft', 'in_review'): 'author',  # Author submits for review
@@ -80,35 +86,141 @@ def validate_transition(current_state, target_state):
     Raises:
         ValidationError: If transition is not allowed
     """
-    if current_state not in VALID_TRANSITIONS:
-        raise ValidationError(f"Unknown current state: '{current_state}'")
+    if current_state in _TERMINAL_STATES:
+        raise ValidationError(
+            "Invalid transition from '%(current)s' to '%(target)s'. "
+            "Valid transitions from '%(current)s': none (terminal state)",
+            code='terminal_state',
+            params={'current': current_state, 'target': target_state},
+        )
+
+    valid_targets = VALID_TRANSITIONS.get(current_state)
+    if valid_targets is None:
+        raise ValidationError(
+            "Unknown current state: '%(current)s'",
+            code='unknown_state',
+            params={'current': current_state},
+        )
 
-    valid_targets = VALID_TRANSITIONS[current_state]
     if target_state not in valid_targets:
-        valid_str = ', '.join(valid_targets) if valid_targets else 'none (terminal state)'
+        # Message interpolation is deferred to ValidationError via params, so
+        # the happy path never builds any of these strings.
         raise ValidationError(
-            f"Invalid transition from '{current_state}' to '{target_state}'. "
-            f"Valid transitions from '{current_state}': {valid_str}"
+            "Invalid transition from '%(current)s' to '%(target)s'. "
+            "Valid transitions from '%(current)s': %(valid)s",
+            code='invalid_transition',
+            params={
+                'current': current_state,
+                'target': target_state,
+                'valid': ', '.join(valid_targets) if valid_targets else 'none (terminal state)',
+            },
         )
     return True
 
 
+class Transition(NamedTuple):
+    """Immutable descriptor for a single available lifecycle transition."""
+    target_state: str
+    label: str
+    permission_required: str
+
+    def as_dict(self):
+        """Return a plain dict suitable for API responses."""
+        return self._asdict()
+
+
+# Transition descriptors per source state, built once at import time.
+_AVAILABLE_TRANSITIONS_CACHE = {
+    state: tuple(
+        Transition(
+            target,
+            TRANSITION_LABELS.get((state, target), f'Move to {target}'),
+            TRANSITION_PERMISSIONS.get((state, target), 'admin'),
+        )
+        for target in targets
+    )
+    for state, targets in VALID_TRANSITIONS.items()
+}
+
+
 def get_available_transitions(current_state):
     """
     Get list of available transitions from current state.
 
     Returns:
-        list of dicts with target_state, label, permission_required
+        list of Transition tuples with target_state, label, permission_required
     """
-    targets = VALID_TRANSITIONS.get(current_state, [])
-    result = []
-    for target in targets:
-        result.append({
-            'target_state': target,
-            'label': TRANSITION_LABELS.get((current_state, target), f'Move to {target}'),
-            'permission_required': TRANSITION_PERMISSIONS.get((current_state, target), 'admin'),
-        })
-    return result
+    if current_state in _TERMINAL_STATES:
+        return []
+    return list(_AVAILABLE_TRANSITIONS_CACHE.get(current_state, ()))
+
+
+def _approver_exists(user, document):
+    # Batch callers pre-populate the assigned approver ids to avoid a query per check
+    approver_ids = getattr(document, '_approver_user_ids_cache', None)
+    if approver_ids is not None:
+        return user.pk in approver_ids
+    return document.approvers.filter(approver=user).exists()
+
+
+def _perm_system(user, document, is_staff, owner_match):
+    return True, 'System transition'
+
+
+def _perm_author(user, document, is_staff, owner_match):
+    if owner_match:
+        return True, 'Author permission'
+    return False, 'Only the document author/owner can perform this action'
+
+
+def _perm_author_or_admin(user, document, is_staff, owner_match):
+    if owner_match or is_staff:
+        return True, 'Author or admin permission'
+    return False, 'Only the document author/owner or admin can perform this action'
+
+
+def _perm_reviewer(user, document, is_staff, owner_match):
+    if is_staff or _approver_exists(user, document):
+        return True, 'Reviewer permission'
+    return False, 'Only assigned reviewers can reject documents'
+
+
+def _perm_approver(user, document, is_staff, owner_match):
+    # Check if user is an assigned approver
+    if _approver_exists(user, document):
+        return True, 'Approver permission'
+    if is_staff:
+        return True, 'Admin override'
+    return False, 'Only assigned approvers can approve documents'
+
+
+def _perm_system_or_admin(user, document, is_staff, owner_match):
+    if is_staff:
+        return True, 'Admin permission'
+    return False, 'Only system or admin can perform this action'
+
+
+def _perm_admin(user, document, is_staff, owner_match):
+    if is_staff:
+        return True, 'Admin permission'
+    return False, 'Only administrators can perform this action'
+
+
+_PERM_HANDLERS = {
+    'system': _perm_system,
+    'author': _perm_author,
+    'author_or_admin': _perm_author_or_admin,
+    'reviewer': _perm_reviewer,
+    'approver': _perm_approver,
+    'system_or_admin': _perm_system_or_admin,
+    'admin': _perm_admin,
+}
+
+# Flat (current_state, target_state) -> permission handler table.
+_TRANSITION_HANDLER = {
+    transition: _PERM_HANDLERS[perm]
+    for transition, perm in TRANSITION_PERMISSIONS.items()
+}
 
 
 def check_transition_permission(current_state, target_state, user, document):
@@ -118,44 +230,55 @@ def check_transition_permission(current_state, target_state, user, document):
     Returns:
         tuple: (allowed: bool, reason: str)
     """
-    perm = TRANSITION_PERMISSIONS.get((current_state, target_state), 'admin')
-
-    if perm == 'system':
-        return True, 'System transition'
-
-    if perm == 'author':
-        if document.owner == user or document.created_by == user:
-            return True, 'Author permission'
-        return False, 'Only the document author/owner can perform this action'
-
-    if perm == 'author_or_admin':
-        if document.owner == user or document.created_by == user or user.is_staff:
-            return True, 'Author or admin permission'
-        return False, 'Only the document author/owner or admin can perform this action'
-
-    if perm == 'reviewer':
-        is_approver = document.approvers.filter(approver=user).exists()
-        if is_approver or user.is_staff:
-            return True, 'Reviewer permission'
-        return False, 'Only assigned reviewers can reject documents'
-
-    if perm == 'approver':
-        # Check if user is an assigned approver
-        is_approver = document.approvers.filter(approver=user).exists()
-        if is_approver:
-            return True, 'Approver permission'
-        if user.is_staff:
-            return True, 'Admin override'
-        return False, 'Only assigned approvers can approve documents'
-
-    if perm == 'system_or_admin':
-        if user.is_staff:
-            return True, 'Admin permission'
-        return False, 'Only system or admin can perform this action'
-
-    if perm == 'admin':
-        if user.is_staff:
-            return True, 'Admin permission'
-        return False, 'Only administrators can perform this action'
-
-    return False, f'Unknown permission type: {perm}'
+    handler = _TRANSITION_HANDLER.get((current_state, target_state))
+    if handler is None:
+        return False, 'Invalid transition'
+    # Resolve the staff flag and ownership once; compare FK ids so no related
+    # User rows are loaded.
+    user_id = user.pk
+    is_staff = bool(getattr(user, 'is_staff', False))
+    owner_match = user_id is not None and (
+        document.owner_id == user_id or document.created_by_id == user_id
+    )
+    return handler(user, document, is_staff, owner_match)
+
+
+def check_transition_permission_cached(current_state, target_state, user, document, *, cache):
+    """
+    Memoized variant of check_transition_permission.
+
+    ``cache`` is a caller-owned dict scoped to a single request. The key
+    includes the current state, so a state change on the document never
+    reuses a stale result.
+    """
+    key = (user.pk, document.pk, current_state, target_state)
+    result = cache.get(key)
+    if result is None:
+        result = cache[key] = check_transition_permission(current_state, target_state, user, document)
+    return result
+
+
+def get_available_transitions_for_documents(documents, user):
+    """
+    Resolve the transitions ``user`` may perform across many documents.
+
+    Approvers are prefetched once for the whole batch, so permission checks
+    run in-process instead of issuing an EXISTS query per document.
+
+    Returns:
+        dict mapping document pk to a list of permitted Transition tuples
+    """
+    documents = list(documents)
+    prefetch_related_objects(documents, 'approvers')
+
+    result = {}
+    for document in documents:
+        document._approver_user_ids_cache = {
+            a.approver_id for a in document.approvers.all()
+        }
+        state = document.vault_state
+        result[document.pk] = [
+            t for t in _AVAILABLE_TRANSITIONS_CACHE.get(state, ())
+            if check_transition_permission(state, t.target_state, user, document)[0]
+        ]
+    return result
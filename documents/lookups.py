@@ -0,0 +1,135 @@
+"""
+Cache-aside lookups for document classification reference data.
+
+DocumentInfocardType and DocumentSubType are small, effectively read-only
+tables referenced by every Document. Instances are cached by primary key,
+and the serialized infocard type list is cached under a version number that
+is bumped on any mutation. Invalidation is wired up in documents.signals.
+
+Rendered document list pages are cached the same way, under a version
+bumped whenever a document or anything shown on its list row changes.
+"""
+import hashlib
+import time
+
+from django.core.cache import cache
+
+from .models import DocumentInfocardType, DocumentSubType
+
+LOOKUP_TTL = 60 * 60
+LIST_LOCK_TTL = 30
+
+INFOCARD_TYPE_KEY = 'ict:{pk}'
+SUBTYPE_KEY = 'dst:{pk}'
+INFOCARD_TYPE_LIST_VERSION_KEY = 'ict:list:version'
+INFOCARD_TYPE_LIST_KEY = 'ict:list:v{version}'
+DOCUMENT_LIST_VERSION_KEY = 'doc:list:version'
+DOCUMENT_LIST_KEY = 'doc:list:v{version}:{digest}'
+# Safety net for list-row changes made without a signal or sync call
+DOCUMENT_LIST_TTL = 60 * 5
+
+
+def _get_cached(key, loader):
+    obj = cache.get(key)
+    if obj is None:
+        obj = loader()
+        cache.set(key, obj, LOOKUP_TTL)
+    return obj
+
+
+def get_infocard_type(pk):
+    """Return the DocumentInfocardType with ``pk``, raising DoesNotExist if missing."""
+    pk = int(pk)
+    return _get_cached(
+        INFOCARD_TYPE_KEY.format(pk=pk),
+        lambda: DocumentInfocardType.objects.get(pk=pk),
+    )
+
+
+def get_subtype(pk):
+    """Return the DocumentSubType with ``pk`` (parent type included), raising DoesNotExist if missing."""
+    pk = int(pk)
+    return _get_cached(
+        SUBTYPE_KEY.format(pk=pk),
+        lambda: DocumentSubType.objects.select_related('infocard_type').get(pk=pk),
+    )
+
+
+def get_infocard_type_list_data():
+    """
+    Return the serialized infocard type list.
+
+    The list is cached under the current version number, so a build that
+    races an invalidation can only write to a retired key. On a miss, only
+    the worker that wins the ``cache.add`` lock writes the entry back;
+    concurrent misses serve the list they built without writing it.
+    """
+    from .serializers import DocumentInfocardTypeSerializer
+
+    version = cache.get_or_set(INFOCARD_TYPE_LIST_VERSION_KEY, time.time_ns, None)
+    key = INFOCARD_TYPE_LIST_KEY.format(version=version)
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    data = DocumentInfocardTypeSerializer(DocumentInfocardType.objects.all(), many=True).data
+    data = [dict(item) for item in data]
+    lock_key = f'{key}:lock'
+    if cache.add(lock_key, 1, LIST_LOCK_TTL):
+        try:
+            cache.set(key, data, LOOKUP_TTL)
+        finally:
+            cache.delete(lock_key)
+    return data
+
+
+def get_document_list_data(request, build):
+    """
+    Return the document list response data for ``request``, calling
+    ``build()`` to produce it on a miss.
+
+    Entries are keyed by the absolute URI with its query parameters sorted,
+    under the current list version. The list queryset does not vary by
+    user, so users share entries.
+    """
+    version = cache.get_or_set(DOCUMENT_LIST_VERSION_KEY, time.time_ns, None)
+    query = sorted(request.GET.lists())
+    uri = request.build_absolute_uri(request.path) + '?' + repr(query)
+    digest = hashlib.blake2b(uri.encode(), digest_size=16).hexdigest()
+    key = DOCUMENT_LIST_KEY.format(version=version, digest=digest)
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, DOCUMENT_LIST_TTL)
+    return data
+
+
+def invalidate_document_lists():
+    """Retire every cached document list page."""
+    _bump_version(DOCUMENT_LIST_VERSION_KEY)
+
+
+def invalidate_infocard_type(pk):
+    """Drop a cached infocard type and every cached entry derived from it."""
+    cache.delete(INFOCARD_TYPE_KEY.format(pk=pk))
+    _bump_version(INFOCARD_TYPE_LIST_VERSION_KEY)
+    # Subtypes embed their parent type; they expire on their own TTL, but
+    # drop them now so renames show up immediately.
+    cache.delete_many([
+        SUBTYPE_KEY.format(pk=sub_pk)
+        for sub_pk in DocumentSubType.objects.filter(infocard_type_id=pk).values_list('pk', flat=True)
+    ])
+
+
+def invalidate_subtype(pk):
+    """Drop a cached subtype."""
+    cache.delete(SUBTYPE_KEY.format(pk=pk))
+
+
+def _bump_version(version_key):
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        # Version key evicted or never set; a fresh timestamp cannot collide
+        # with any list entry still cached under an older version.
+        cache.set(version_key, time.time_ns(), None)
@@ -0,0 +1,177 @@
+"""
+Backfill DocumentSnapshot rows for existing documents using PostgreSQL COPY.
+
+Going through DocumentSnapshot.save() issues one INSERT (and one round of
+index maintenance) per row. For historical backfills this command instead
+streams all rows through a single COPY, with the table's non-unique indexes
+dropped for the duration of the load and rebuilt once afterwards. Payloads
+are written to SnapshotBlob first with a single bulk insert that skips
+hashes already stored.
+
+The whole load runs in one transaction, so a failure leaves both the rows
+and the indexes untouched. Dropping the indexes takes an exclusive lock on
+the snapshot table until the command commits; run it during a maintenance
+window on production data.
+"""
+import csv
+import io
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from documents.models import Document, DocumentSnapshot, SnapshotBlob
+
+
+COPY_COLUMNS = (
+    'document_id', 'version_string', 'snapshot_type',
+    'snapshot_blob_id', 'created_at', 'created_by_id',
+)
+
+
+def _snapshot_data(doc):
+    """Frozen document state recorded by a backfilled snapshot."""
+    return {
+        'document_id': doc['document_id'],
+        'title': doc['title'],
+        'vault_state': doc['vault_state'],
+        'version': f"{doc['major_version']}.{doc['minor_version']}",
+        'effective_date': str(doc['effective_date']) if doc['effective_date'] else None,
+        'released_date': str(doc['released_date']) if doc['released_date'] else None,
+        'backfilled': True,
+    }
+
+
+def snapshots_bulk_copy(records):
+    """
+    Load snapshot ``records`` into DocumentSnapshot with a single COPY.
+
+    Each record is a dict keyed by COPY_COLUMNS; the referenced SnapshotBlob
+    rows must already exist. Must be called inside a transaction; the dropped
+    indexes are recreated before returning.
+    """
+    table = DocumentSnapshot._meta.db_table
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for record in records:
+        writer.writerow([
+            '' if record[column] is None else record[column]
+            for column in COPY_COLUMNS
+        ])
+    buf.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL synchronous_commit = off')
+        # Non-unique, non-constraint indexes only: the primary key must stay.
+        cursor.execute(
+            """
+            SELECT i.indexname, i.indexdef
+            FROM pg_indexes i
+            WHERE i.tablename = %s
+              AND i.indexname NOT IN (
+                  SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass
+              )
+              AND i.indexdef NOT LIKE 'CREATE UNIQUE INDEX%%'
+            """,
+            [table, table],
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX "{name}"')
+
+        cursor.copy_expert(
+            f'COPY {table} ({", ".join(COPY_COLUMNS)}) FROM STDIN WITH CSV',
+            buf,
+        )
+
+        # Django's FK constraints are deferred; CREATE INDEX refuses to run
+        # while their checks for the copied rows are still pending.
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        for _, definition in indexes:
+            cursor.execute(definition)
+        cursor.execute('SET CONSTRAINTS ALL DEFERRED')
+    return len(indexes)
+
+
+class Command(BaseCommand):
+    help = 'Backfill document snapshots in bulk via PostgreSQL COPY'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--snapshot-type',
+            default='review',
+            choices=[choice for choice, _ in DocumentSnapshot.SNAPSHOT_TYPE_CHOICES],
+            help='Snapshot type to record (default: review)'
+        )
+        parser.add_argument(
+            '--vault-state', action='append', default=[],
+            help='Only snapshot documents in this vault state (repeatable)'
+        )
+        parser.add_argument(
+            '--created-by',
+            help='Username recorded as the snapshot creator'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report how many snapshots would be written without loading them'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('snapshots_bulk_copy requires PostgreSQL (COPY FROM STDIN).')
+
+        snapshot_type = options['snapshot_type']
+        created_by_id = None
+        if options['created_by']:
+            try:
+                created_by_id = User.objects.get(username=options['created_by']).pk
+            except User.DoesNotExist:
+                raise CommandError(f"User '{options['created_by']}' not found")
+
+        # Skip documents that already have this snapshot type for their current version
+        existing = set(
+            DocumentSnapshot.objects.filter(snapshot_type=snapshot_type)
+            .values_list('document_id', 'version_string')
+        )
+        docs = Document.objects.select_related(None).values(
+            'id', 'document_id', 'title', 'vault_state', 'major_version',
+            'minor_version', 'effective_date', 'released_date',
+        )
+        if options['vault_state']:
+            docs = docs.filter(vault_state__in=options['vault_state'])
+
+        now = timezone.now().isoformat()
+        blobs = {}
+        records = []
+        for doc in docs.iterator(chunk_size=2000):
+            version_string = f"{doc['major_version']}.{doc['minor_version']}"
+            if (doc['id'], version_string) in existing:
+                continue
+            payload = _snapshot_data(doc)
+            digest = SnapshotBlob.digest(payload)
+            blobs[digest] = payload
+            records.append({
+                'document_id': doc['id'],
+                'version_string': version_string,
+                'snapshot_type': snapshot_type,
+                'snapshot_blob_id': digest,
+                'created_at': now,
+                'created_by_id': created_by_id,
+            })
+
+        if options['dry_run'] or not records:
+            self.stdout.write(f'{len(records)} {snapshot_type} snapshots to write')
+            return
+
+        with transaction.atomic():
+            SnapshotBlob.objects.bulk_create(
+                [SnapshotBlob(sha256=digest, payload=payload) for digest, payload in blobs.items()],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+            rebuilt = snapshots_bulk_copy(records)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Copied {len(records)} {snapshot_type} snapshots (rebuilt {rebuilt} indexes)'
+        ))
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def deactivate_duplicate_checkouts(apps, schema_editor):
+    """Keep only the most recent active checkout per document."""
+    DocumentCheckout = apps.get_model('documents', 'DocumentCheckout')
+    seen = set()
+    stale = []
+    for checkout in DocumentCheckout.objects.filter(is_active=True).order_by(
+        'document_id', '-checked_out_at', '-id'
+    ).only('id', 'document_id'):
+        if checkout.document_id in seen:
+            stale.append(checkout.id)
+        else:
+            seen.add(checkout.document_id)
+    if stale:
+        DocumentCheckout.objects.filter(id__in=stale).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0009_document_columns_count_document_editor_metadata_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(deactivate_duplicate_checkouts, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='documentcheckout',
+            name='documents_d_documen_a0c948_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='documentcheckout',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('document',), name='uniq_active_checkout_per_doc'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:25
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0010_documentcheckout_unique_active'),
+        ('users', '0004_role_field_level_permissions_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['content'], name='doc_content_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['training_applicable_roles'], name='doc_training_roles_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['subject_keywords'], name='doc_keywords_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='documentchangeorder',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['affected_processes'], name='dco_affected_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='documentsnapshot',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['snapshot_data'], name='docsnap_data_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='documentversion',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['snapshot_data'], name='docver_snapshot_gin'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:26
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+SEARCH_VECTOR_EXPRESSION = """
+    setweight(to_tsvector('pg_catalog.english', coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('pg_catalog.english', coalesce({row}description, '')), 'B') ||
+    setweight(jsonb_to_tsvector('pg_catalog.english', coalesce({row}subject_keywords, '[]'::jsonb), '["string"]'), 'B') ||
+    setweight(to_tsvector('pg_catalog.english', coalesce({row}content_plain_text, '')), 'C')
+"""
+
+CREATE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION documents_document_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_EXPRESSION.format(row='NEW.')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER documents_document_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, subject_keywords, content_plain_text, search_vector
+    ON documents_document
+    FOR EACH ROW EXECUTE FUNCTION documents_document_search_vector_update();
+
+UPDATE documents_document SET search_vector = {SEARCH_VECTOR_EXPRESSION.format(row='')};
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS documents_document_search_vector_trigger ON documents_document;
+DROP FUNCTION IF EXISTS documents_document_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0011_jsonb_gin_indexes'),
+        ('users', '0004_role_field_level_permissions_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, help_text='Weighted tsvector of title/description/keywords/content_plain_text, maintained by a DB trigger', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='doc_search_gin'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+    ]
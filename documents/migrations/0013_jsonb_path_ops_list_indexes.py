@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:28
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0012_document_search_vector'),
+        ('users', '0004_role_field_level_permissions_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='document',
+            name='doc_training_roles_gin',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='doc_keywords_gin',
+        ),
+        migrations.RemoveIndex(
+            model_name='documentchangeorder',
+            name='dco_affected_gin',
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['training_applicable_roles'], name='doc_training_roles_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['subject_keywords'], name='doc_keywords_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='documentchangeorder',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['affected_processes'], name='dco_affected_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
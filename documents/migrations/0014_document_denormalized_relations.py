@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_denormalized_relations(apps, schema_editor):
+    """Populate current_checkout, current_version and pending_approver_count."""
+    from django.db.models import Count, OuterRef, Subquery, Value
+    from django.db.models.functions import Coalesce
+
+    Document = apps.get_model('documents', 'Document')
+    DocumentCheckout = apps.get_model('documents', 'DocumentCheckout')
+    DocumentVersion = apps.get_model('documents', 'DocumentVersion')
+    DocumentApprover = apps.get_model('documents', 'DocumentApprover')
+
+    Document.objects.update(
+        current_checkout=Subquery(
+            DocumentCheckout.objects.filter(
+                document=OuterRef('pk'), is_active=True
+            ).order_by('-checked_out_at').values('pk')[:1]
+        ),
+        current_version=Subquery(
+            DocumentVersion.objects.filter(
+                document=OuterRef('pk')
+            ).order_by('-major_version', '-minor_version', '-pk').values('pk')[:1]
+        ),
+        pending_approver_count=Coalesce(
+            Subquery(
+                DocumentApprover.objects.filter(
+                    document=OuterRef('pk'), approval_status='pending'
+                ).values('document').annotate(n=Count('pk')).values('n')[:1]
+            ),
+            Value(0),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0013_jsonb_path_ops_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='current_checkout',
+            field=models.OneToOneField(blank=True, editable=False, help_text='Currently active checkout, if any', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='documents.documentcheckout'),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='current_version',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Latest DocumentVersion record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='documents.documentversion'),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='pending_approver_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of approvers with a pending decision'),
+        ),
+        migrations.RunPython(backfill_denormalized_relations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_notification'),
+        ('documents', '0014_document_denormalized_relations'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='documentapprover',
+            name='documents_d_approve_9e731b_idx',
+        ),
+        migrations.AddIndex(
+            model_name='documentapprover',
+            index=models.Index(fields=['approver', 'approval_status'], include=('document', 'sequence', 'is_final_approver'), name='approver_pending_covering'),
+        ),
+    ]
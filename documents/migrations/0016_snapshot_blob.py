@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:40
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import hashlib
+import json
+from collections import defaultdict
+from django.db import migrations, models
+
+
+def _digest(payload):
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def move_snapshot_data_to_blobs(apps, schema_editor):
+    """Store each distinct snapshot payload once and point snapshots at it."""
+    DocumentSnapshot = apps.get_model('documents', 'DocumentSnapshot')
+    SnapshotBlob = apps.get_model('documents', 'SnapshotBlob')
+
+    payloads = {}
+    snapshot_ids = defaultdict(list)
+    for pk, data in DocumentSnapshot.objects.values_list('pk', 'snapshot_data').iterator():
+        digest = _digest(data)
+        payloads[digest] = data
+        snapshot_ids[digest].append(pk)
+
+    SnapshotBlob.objects.bulk_create(
+        [SnapshotBlob(sha256=digest, payload=data) for digest, data in payloads.items()],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+    for digest, ids in snapshot_ids.items():
+        DocumentSnapshot.objects.filter(pk__in=ids).update(snapshot_blob_id=digest)
+
+
+def restore_snapshot_data(apps, schema_editor):
+    from django.db.models import OuterRef, Subquery
+
+    DocumentSnapshot = apps.get_model('documents', 'DocumentSnapshot')
+    SnapshotBlob = apps.get_model('documents', 'SnapshotBlob')
+    DocumentSnapshot.objects.update(
+        snapshot_data=Subquery(
+            SnapshotBlob.objects.filter(sha256=OuterRef('snapshot_blob_id')).values('payload')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0015_documentapprover_covering_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SnapshotBlob',
+            fields=[
+                ('sha256', models.CharField(help_text='SHA-256 of the canonical JSON payload', max_length=64, primary_key=True, serialize=False)),
+                ('payload', models.JSONField(help_text='Frozen document state shared by all snapshots with this hash')),
+            ],
+            options={
+                'verbose_name': 'Snapshot Blob',
+                'verbose_name_plural': 'Snapshot Blobs',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['payload'], name='snapblob_payload_gin')],
+            },
+        ),
+        migrations.AddField(
+            model_name='documentsnapshot',
+            name='snapshot_blob',
+            field=models.ForeignKey(help_text='Content-addressed frozen state of entire document at this point', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='snapshots', to='documents.snapshotblob'),
+        ),
+        # Nullable first so the reverse migration can re-add the column to a populated table
+        migrations.AlterField(
+            model_name='documentsnapshot',
+            name='snapshot_data',
+            field=models.JSONField(help_text='Immutable frozen state of entire document at this point', null=True),
+        ),
+        migrations.RunPython(move_snapshot_data_to_blobs, restore_snapshot_data),
+    ]
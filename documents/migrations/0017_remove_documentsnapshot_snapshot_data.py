@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Kept separate from 0016 so the schema changes below do not run in the
+    # same transaction as its data migration (pending deferred FK checks).
+
+    dependencies = [
+        ('documents', '0016_snapshot_blob'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='documentsnapshot',
+            name='docsnap_data_gin',
+        ),
+        migrations.RemoveField(
+            model_name='documentsnapshot',
+            name='snapshot_data',
+        ),
+        migrations.AlterField(
+            model_name='documentsnapshot',
+            name='snapshot_blob',
+            field=models.ForeignKey(help_text='Content-addressed frozen state of entire document at this point', on_delete=django.db.models.deletion.PROTECT, related_name='snapshots', to='documents.snapshotblob'),
+        ),
+    ]
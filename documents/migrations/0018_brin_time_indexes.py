@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:43
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0017_remove_documentsnapshot_snapshot_data'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='documentsnapshot',
+            name='documents_d_created_a2231e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='documentchangeorder',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='dco_created_brin', pages_per_range=32),
+        ),
+        migrations.AddIndex(
+            model_name='documentcheckout',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['checked_out_at'], name='doccheckout_out_at_brin', pages_per_range=32),
+        ),
+        migrations.AddIndex(
+            model_name='documentsnapshot',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='docsnap_created_brin', pages_per_range=32),
+        ),
+    ]
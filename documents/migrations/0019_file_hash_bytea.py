@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0018_brin_time_indexes'),
+    ]
+
+    operations = [
+        # Convert the hex digests in place; a plain ::bytea cast would store the
+        # ASCII text of the hex string instead of the 32-byte digest.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql="""
+                        ALTER TABLE documents_document
+                            ALTER COLUMN file_hash DROP NOT NULL,
+                            ALTER COLUMN file_hash TYPE bytea USING (
+                                CASE WHEN file_hash ~ '^[0-9a-fA-F]{64}$'
+                                     THEN decode(file_hash, 'hex')
+                                END
+                            );
+                    """,
+                    reverse_sql="""
+                        ALTER TABLE documents_document
+                            ALTER COLUMN file_hash TYPE varchar(64)
+                                USING COALESCE(encode(file_hash, 'hex'), ''),
+                            ALTER COLUMN file_hash SET NOT NULL;
+                    """,
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='document',
+                    name='file_hash',
+                    field=models.BinaryField(blank=True, help_text='Raw 32-byte SHA-256 digest of uploaded file for integrity verification', max_length=32, null=True),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['file_hash'], name='doc_file_hash_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:47
+
+from django.db import migrations, models
+
+
+# Assigns DCO-<year>-<nnnn> from a per-year sequence. The sequence is created
+# on first use and seeded from the highest number already issued that year,
+# so it continues any numbering assigned before the trigger existed.
+CREATE_TRIGGER_SQL = r"""
+CREATE OR REPLACE FUNCTION documents_dco_change_number() RETURNS trigger AS $$
+DECLARE
+    y int := extract(year from now());
+    seqname text := format('dco_seq_%s', y);
+    last_number int;
+    n bigint;
+BEGIN
+    IF NEW.change_number IS NULL OR NEW.change_number = '' THEN
+        IF to_regclass(seqname) IS NULL THEN
+            EXECUTE format('CREATE SEQUENCE IF NOT EXISTS %I', seqname);
+            SELECT max(substring(change_number from '(\d+)$')::int) INTO last_number
+              FROM documents_documentchangeorder
+             WHERE change_number LIKE format('DCO-%s-%%', y);
+            IF last_number IS NOT NULL THEN
+                PERFORM setval(seqname, last_number);
+            END IF;
+        END IF;
+        n := nextval(seqname);
+        NEW.change_number := format('DCO-%s-%s', y, lpad(n::text, greatest(4, length(n::text)), '0'));
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER documents_dco_change_number_trigger
+    BEFORE INSERT ON documents_documentchangeorder
+    FOR EACH ROW EXECUTE FUNCTION documents_dco_change_number();
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS documents_dco_change_number_trigger ON documents_documentchangeorder;
+DROP FUNCTION IF EXISTS documents_dco_change_number();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0019_file_hash_bytea'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='documentchangeorder',
+            name='change_number',
+            field=models.CharField(blank=True, db_default='', help_text='Unique identifier for this change order (assigned by a database trigger on insert)', max_length=50, unique=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_notification'),
+        ('documents', '0020_dco_change_number_trigger'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='documentapprover',
+            name='approver_pending_covering',
+        ),
+        migrations.AddIndex(
+            model_name='documentapprover',
+            index=models.Index(condition=models.Q(('approval_status', 'pending')), fields=['approver', 'sequence'], include=('document', 'is_final_approver'), name='approver_pending_partial'),
+        ),
+        migrations.AddIndex(
+            model_name='documentchangeapproval',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['approver'], name='dco_approval_pending_partial'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:49
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0021_pending_approval_partial_indexes'),
+        ('users', '0004_role_field_level_permissions_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='document',
+            name='doc_content_gin',
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['content'], name='doc_content_jsonb_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0022_content_jsonb_path_ops'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentIdSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=10)),
+                ('year', models.PositiveIntegerField()),
+                ('last_number', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Document ID Sequence',
+                'verbose_name_plural': 'Document ID Sequences',
+                'unique_together': {('prefix', 'year')},
+            },
+        ),
+    ]
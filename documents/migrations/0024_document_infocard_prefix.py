@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0023_document_id_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='infocard_prefix',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Copy of infocard_type.prefix, kept in step on save and on prefix changes', max_length=10),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE documents_document d
+                   SET infocard_prefix = t.prefix
+                  FROM documents_documentinfocardtype t
+                 WHERE t.id = d.infocard_type_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
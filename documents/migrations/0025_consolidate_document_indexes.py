@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0024_document_infocard_prefix'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_documen_612cf4_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_owner_i_fa3cc1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_created_54b6f7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_is_lock_aa8d1b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_require_d34f38_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_require_3e0294_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_is_temp_62407b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_major_v_e68796_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_created_71dced_idx',
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(condition=models.Q(('is_locked', True)), fields=['-created_at'], name='doc_locked_partial'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(condition=models.Q(('requires_training', True)), fields=['-created_at'], name='doc_training_partial'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(condition=models.Q(('is_template', True)), fields=['-created_at'], name='doc_template_partial'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:11
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0025_consolidate_document_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='documentacknowledgment',
+            name='documents_d_documen_f2a335_idx',
+        ),
+    ]
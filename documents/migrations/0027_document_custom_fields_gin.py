@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:19
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0026_drop_acknowledgment_duplicate_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['custom_fields'], name='doc_custom_fields_gin'),
+        ),
+    ]
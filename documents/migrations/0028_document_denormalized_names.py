@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0027_document_custom_fields_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='department_name',
+            field=models.CharField(blank=True, editable=False, help_text='Copy of department.name, kept in step on save and on renames', max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='infocard_type_name',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Copy of infocard_type.name, kept in step on save and on renames', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='owner_username',
+            field=models.CharField(blank=True, editable=False, help_text='Copy of owner.username, kept in step on save and on renames', max_length=150, null=True),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE documents_document d
+                   SET infocard_type_name = t.name
+                  FROM documents_documentinfocardtype t
+                 WHERE t.id = d.infocard_type_id;
+                UPDATE documents_document d
+                   SET department_name = dep.name
+                  FROM users_department dep
+                 WHERE dep.id = d.department_id;
+                UPDATE documents_document d
+                   SET owner_username = u.username
+                  FROM auth_user u
+                 WHERE u.id = d.owner_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
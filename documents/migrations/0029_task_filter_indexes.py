@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0028_document_denormalized_names'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['vault_state', 'next_review_date'], name='doc_state_review_idx'),
+        ),
+        # Covered by doc_state_review_idx
+        migrations.RemoveIndex(
+            model_name='document',
+            name='documents_d_vault_s_3ca4ef_idx',
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(condition=models.Q(('vault_state', 'in_review')), fields=['updated_at'], name='doc_inreview_updated'),
+        ),
+    ]
@@ -11,19 +11,51 @@ This module provides a comprehensive document management system including:
 - Immutable snapshots at key lifecycle points
 """
 
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.core.exceptions import ValidationError
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
+import functools
 import hashlib
 import json
+import logging
+import re
 from datetime import datetime, timedelta
 
+from core.hashing import sha256_file, uploaded_sha256
 from core.models import AuditedModel
 from users.models import Department
 
+logger = logging.getLogger(__name__)
+
+
+def user_full_name(user):
+    """
+    Expression for the display name of the user at lookup path ``user``:
+    "first last", or the username when both are blank.
+    """
+    from django.db.models.functions import Coalesce, Concat, NullIf, Trim
+
+    return Coalesce(
+        NullIf(
+            Trim(Concat(f'{user}__first_name', models.Value(' '), f'{user}__last_name')),
+            models.Value(''),
+        ),
+        f'{user}__username',
+    )
+
+
+def display_name(user):
+    """Python counterpart of user_full_name() for a loaded ``user``."""
+    if user is None:
+        return None
+    return f"{user.first_name} {user.last_name}".strip() or user.username
+
 
 class DocumentInfocardType(AuditedModel):
     """
@@ -151,7 +183,15 @@ class DocumentCheckout(models.Model):
         verbose_name_plural = "Document Checkouts"
         indexes = [
             models.Index(fields=['is_active', 'checked_out_by']),
-            models.Index(fields=['document', 'is_active']),
+            BrinIndex(fields=['checked_out_at'], name='doccheckout_out_at_brin', pages_per_range=32),
+        ]
+        constraints = [
+            # Partial unique index: the database rejects a second active checkout
+            models.UniqueConstraint(
+                fields=['document'],
+                condition=models.Q(is_active=True),
+                name='uniq_active_checkout_per_doc',
+            ),
         ]
     
     def __str__(self):
@@ -234,13 +274,44 @@ class DocumentApprover(models.Model):
         indexes = [
             models.Index(fields=['document', 'sequence']),
             models.Index(fields=['approval_status']),
-            models.Index(fields=['approver', 'approval_status']),
+            # Partial covering index for the approver workload query
+            # (approver=user, approval_status='pending', ordered by sequence).
+            # Decided rows are excluded, keeping the index small, and the
+            # INCLUDE columns allow an index-only scan.
+            models.Index(
+                fields=['approver', 'sequence'],
+                condition=models.Q(approval_status='pending'),
+                include=['document', 'is_final_approver'],
+                name='approver_pending_partial',
+            ),
         ]
     
     def __str__(self):
         return f"{self.document.document_id} - {self.approver.username} (Step {self.sequence})"
 
 
+class DocumentCollaboratorQuerySet(models.QuerySet):
+    """QuerySet helpers for DocumentCollaborator."""
+
+    def with_user_details(self):
+        """
+        Join the user and annotate ``full_name`` and ``department`` as read
+        by DocumentCollaboratorSerializer.
+
+        ``full_name`` is "first last", or the username when both are blank;
+        ``department`` is the profile department name, or '' when unset.
+        """
+        from django.db.models.functions import Coalesce
+
+        return self.select_related('user').annotate(
+            full_name=user_full_name('user'),
+            department=Coalesce(
+                'user__profile__department__name', models.Value(''),
+                output_field=models.CharField(),
+            ),
+        )
+
+
 class DocumentCollaborator(models.Model):
     """Tracks collaborators assigned to a document with their roles."""
     ROLE_CHOICES = [
@@ -287,6 +358,8 @@ class DocumentCollaborator(models.Model):
     added_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DocumentCollaboratorQuerySet.as_manager()
+
     class Meta:
         unique_together = ['document', 'user']
         ordering = ['-added_at']
@@ -295,6 +368,50 @@ class DocumentCollaborator(models.Model):
         return f"{self.user.username} on {self.document.document_id} ({', '.join(self.roles)})"
 
 
+class SnapshotBlob(models.Model):
+    """
+    Content-addressed snapshot payload.
+
+    Payloads are keyed by the SHA-256 of their canonical JSON encoding, so
+    identical snapshots (e.g. approval and effective snapshots of an unchanged
+    document) share a single row.
+    """
+
+    sha256 = models.CharField(
+        max_length=64,
+        primary_key=True,
+        help_text="SHA-256 of the canonical JSON payload"
+    )
+    payload = models.JSONField(
+        help_text="Frozen document state shared by all snapshots with this hash"
+    )
+
+    class Meta:
+        verbose_name = "Snapshot Blob"
+        verbose_name_plural = "Snapshot Blobs"
+        indexes = [
+            GinIndex(fields=['payload'], name='snapblob_payload_gin'),
+        ]
+
+    def __str__(self):
+        return self.sha256
+
+    @staticmethod
+    def digest(payload):
+        """Return the SHA-256 hex digest of the canonical encoding of ``payload``."""
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def for_payload(cls, payload):
+        """Return the blob storing ``payload``, creating it if needed."""
+        blob, _ = cls.objects.get_or_create(
+            sha256=cls.digest(payload),
+            defaults={'payload': payload},
+        )
+        return blob
+
+
 class DocumentSnapshot(models.Model):
     """
     Immutable snapshot of document state at key lifecycle points.
@@ -330,8 +447,11 @@ class DocumentSnapshot(models.Model):
         choices=SNAPSHOT_TYPE_CHOICES,
         help_text="Type of lifecycle event triggering this snapshot"
     )
-    snapshot_data = models.JSONField(
-        help_text="Immutable frozen state of entire document at this point"
+    snapshot_blob = models.ForeignKey(
+        SnapshotBlob,
+        on_delete=models.PROTECT,
+        related_name='snapshots',
+        help_text="Content-addressed frozen state of entire document at this point"
     )
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -351,16 +471,36 @@ class DocumentSnapshot(models.Model):
         verbose_name_plural = "Document Snapshots"
         indexes = [
             models.Index(fields=['document', 'snapshot_type']),
-            models.Index(fields=['created_at']),
+            # Append-only and insert-ordered: a BRIN summary serves created_at
+            # range scans at a fraction of the size of a btree.
+            BrinIndex(fields=['created_at'], name='docsnap_created_brin', pages_per_range=32),
         ]
     
     def __str__(self):
         return f"{self.document.document_id} v{self.version_string} - {self.snapshot_type}"
+
+    @property
+    def snapshot_data(self):
+        """Frozen document state; accepted as a constructor/create() kwarg."""
+        pending = getattr(self, '_pending_snapshot_data', None)
+        if pending is not None:
+            return pending
+        if self.snapshot_blob_id is None:
+            return None
+        return self.snapshot_blob.payload
+
+    @snapshot_data.setter
+    def snapshot_data(self, value):
+        self._pending_snapshot_data = value
     
     def save(self, *args, **kwargs):
         """Override save to enforce immutability after creation."""
         if self.pk is not None:
             raise ValidationError("Document snapshots are immutable and cannot be modified.")
+        pending = getattr(self, '_pending_snapshot_data', None)
+        if pending is not None:
+            self.snapshot_blob = SnapshotBlob.for_payload(pending)
+            self._pending_snapshot_data = None
         super().save(*args, **kwargs)
 
 
@@ -423,10 +563,34 @@ class DocumentVersion(AuditedModel):
             models.Index(fields=['document', 'major_version']),
             models.Index(fields=['released_date']),
             models.Index(fields=['change_type']),
+            GinIndex(fields=['snapshot_data'], name='docver_snapshot_gin'),
         ]
     
     def __str__(self):
-        return f"{self.document.document_id} v{self.major_version}.{self.minor_version}"
+        return f"{self.document.document_id} v{self.version_string}"
+
+    @property
+    def version_string(self):
+        """Return formatted version string like '2.1'."""
+        return f"{self.major_version}.{self.minor_version}"
+
+    @classmethod
+    def initial_for(cls, document):
+        """Build (unsaved) the initial version recorded when ``document`` is created."""
+        author = document.owner or document.created_by
+        return cls(
+            document=document,
+            major_version=document.major_version,
+            minor_version=document.minor_version,
+            created_by=author,
+            updated_by=author,
+            change_summary='Initial version',
+            snapshot_data={
+                'title': document.title,
+                'vault_state': document.vault_state,
+                'created_at': document.created_at.isoformat() if document.created_at else None,
+            },
+        )
 
 
 class DocumentChangeOrder(models.Model):
@@ -455,7 +619,9 @@ class DocumentChangeOrder(models.Model):
     change_number = models.CharField(
         max_length=50,
         unique=True,
-        help_text="Unique identifier for this change order"
+        blank=True,
+        db_default='',
+        help_text="Unique identifier for this change order (assigned by a database trigger on insert)"
     )
     title = models.CharField(
         max_length=255,
@@ -519,28 +685,13 @@ class DocumentChangeOrder(models.Model):
             models.Index(fields=['change_number']),
             models.Index(fields=['status']),
             models.Index(fields=['regulatory_impact']),
+            GinIndex(fields=['affected_processes'], name='dco_affected_gin', opclasses=['jsonb_path_ops']),
+            BrinIndex(fields=['created_at'], name='dco_created_brin', pages_per_range=32),
         ]
     
     def __str__(self):
         return f"{self.change_number} - {self.title}"
 
-    def save(self, *args, **kwargs):
-        """Override save to auto-generate change_number."""
-        if not self.change_number:
-            from django.utils import timezone as tz
-            year = tz.now().year
-            prefix = 'DCO'
-            last = DocumentChangeOrder.objects.filter(change_number__startswith=f'{prefix}-{year}-').order_by('-change_number').first()
-            if last and getattr(last, 'change_number'):
-                try:
-                    seq = int(getattr(last, 'change_number').split('-')[-1]) + 1
-                except (ValueError, IndexError):
-                    seq = 1
-            else:
-                seq = 1
-            self.change_number = f'{prefix}-{year}-{seq:04d}'
-        super().save(*args, **kwargs)
-
 
 class DocumentChangeApproval(models.Model):
     """
@@ -592,12 +743,212 @@ class DocumentChangeApproval(models.Model):
         indexes = [
             models.Index(fields=['change_order', 'status']),
             models.Index(fields=['approver']),
+            models.Index(
+                fields=['approver'],
+                condition=models.Q(status='pending'),
+                name='dco_approval_pending_partial',
+            ),
         ]
     
     def __str__(self):
         return f"{self.change_order.change_number} - {self.approver.username} ({self.status})"
 
 
+@functools.lru_cache(maxsize=64)
+def document_id_template(prefix, year):
+    """Format string for ``<prefix>-<year>-<nnnn>`` document IDs; call ``.format(n)``."""
+    return f"{prefix}-{year}-{{:04d}}"
+
+
+class DocumentIdSequence(models.Model):
+    """
+    Last issued document ID number per infocard prefix and year.
+
+    Document.auto_generate_document_id() locks and increments the row for
+    its prefix/year, so concurrent creates never pick the same number.
+    """
+    prefix = models.CharField(max_length=10)
+    year = models.PositiveIntegerField()
+    last_number = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Document ID Sequence"
+        verbose_name_plural = "Document ID Sequences"
+        unique_together = [['prefix', 'year']]
+
+    def __str__(self):
+        return f"{self.prefix}-{self.year}: {self.last_number}"
+
+    @classmethod
+    def next_number(cls, prefix, year, count=1):
+        """
+        Reserve ``count`` consecutive numbers for ``prefix``/``year`` and
+        return the first of them.
+        """
+        with transaction.atomic():
+            seq, created = cls.objects.select_for_update().get_or_create(
+                prefix=prefix, year=year,
+            )
+            if created:
+                # Continue numbering assigned before this table existed
+                seq.last_number = cls._max_issued(prefix, year)
+            seq.last_number += count
+            seq.save(update_fields=['last_number'])
+        return seq.last_number - count + 1
+
+    @staticmethod
+    def _max_issued(prefix, year):
+        """Highest number already issued as ``<prefix>-<year>-<n>``, compared numerically."""
+        from django.db.models.functions import Cast, Substr
+
+        start = len(f'{prefix}-{year}-') + 1
+        return Document.objects.select_related(None).filter(
+            document_id__regex=rf'^{re.escape(prefix)}-{year}-[0-9]+$'
+        ).aggregate(
+            last=models.Max(Cast(Substr('document_id', start), models.BigIntegerField()))
+        )['last'] or 0
+
+
+class DocumentQuerySet(models.QuerySet):
+    """QuerySet helpers for loading documents together with their audit relations."""
+
+    def with_full_audit(self):
+        """
+        Prefetch the approval chain (approver user and signature included)
+        in sequence order, so approval history can be rendered without
+        a query per approver row.
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                'approvers',
+                queryset=DocumentApprover.objects.select_related(
+                    'approver', 'signature'
+                ).order_by('sequence'),
+            )
+        )
+
+    def with_detail_relations(self, checkout=True, approval_counts=True):
+        """
+        Join and annotate what DocumentDetailSerializer reads from the
+        document row: the active checkout and its user (through the
+        denormalized current_checkout FK) and the approver counts. The
+        serializer reads versions and approvers as values() rows itself.
+        Either part can be left out when the response does not render it.
+        """
+        qs = self
+        if checkout:
+            qs = qs.select_related('current_checkout__checked_out_by')
+        if approval_counts:
+            qs = qs.with_approval_counts()
+        return qs
+
+    def with_approval_counts(self):
+        """
+        Annotate each document with per-status approver counts
+        (``total_approvers``, ``pending_count``, ``approved_count``,
+        ``rejected_count``, ``deferred_count``) in the same query.
+        Document.get_approval_status() reads these when present.
+        """
+        def status_count(status):
+            return models.Count('approvers', filter=models.Q(approvers__approval_status=status))
+
+        return self.annotate(
+            total_approvers=models.Count('approvers'),
+            pending_count=status_count('pending'),
+            approved_count=status_count('approved'),
+            rejected_count=status_count('rejected'),
+            deferred_count=status_count('deferred'),
+        )
+
+    def with_approval_flags(self):
+        """
+        Annotate ``has_approvers`` and ``fully_approved`` with EXISTS
+        subqueries, matching Document.is_fully_approved(), which reads
+        ``fully_approved`` when present. Cheaper than with_approval_counts()
+        for lists that only show whether a document is approved.
+        """
+        approvers = DocumentApprover.objects.filter(document=models.OuterRef('pk'))
+        has_approvers = models.Exists(approvers)
+        return self.annotate(
+            has_approvers=has_approvers,
+            fully_approved=models.Case(
+                models.When(requires_approval=False, then=models.Value(True)),
+                models.When(
+                    has_approvers & ~models.Exists(approvers.exclude(approval_status='approved')),
+                    then=models.Value(True),
+                ),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            ),
+        )
+
+    def bulk_import(self, documents, batch_size=1000):
+        """
+        Insert unsaved ``documents`` in batches, bypassing Document.save().
+
+        Document IDs are reserved with one counter update per prefix, and
+        each document gets the initial DocumentVersion that the post_save
+        receiver would have created; audit entries are written in bulk. No
+        other post_save receivers run, so this is meant for loading existing
+        (legacy) documents, not for documents entering the lifecycle.
+        Returns the created documents.
+        """
+        from collections import defaultdict
+
+        year = timezone.now().year
+        needs_id = defaultdict(list)
+        for doc in documents:
+            doc.refresh_denormalized_names()
+            if not doc.document_id:
+                needs_id[doc.infocard_prefix].append(doc)
+
+        with transaction.atomic(using=self.db):
+            for prefix, docs in needs_id.items():
+                first = DocumentIdSequence.next_number(prefix, year, count=len(docs))
+                template = document_id_template(prefix, year)
+                for number, doc in enumerate(docs, start=first):
+                    doc.document_id = template.format(number)
+
+            created = self.bulk_create(documents, batch_size=batch_size)
+            versions = DocumentVersion.objects.bulk_create(
+                [DocumentVersion.initial_for(doc) for doc in created],
+                batch_size=batch_size,
+            )
+            for doc, version in zip(created, versions):
+                doc.current_version = version
+            self.bulk_update(created, ['current_version'], batch_size=batch_size)
+
+            from core.signals import log_bulk_create
+            log_bulk_create(Document, created)
+            log_bulk_create(DocumentVersion, versions)
+
+            from .lookups import invalidate_document_lists
+            transaction.on_commit(invalidate_document_lists)
+        return created
+
+
+class DocumentManager(models.Manager.from_queryset(DocumentQuerySet)):
+    """
+    Default manager for Document.
+
+    Joins the forward FK chains needed to display a document so that
+    iterating a queryset does not issue one query per FK per row.
+    Use ``select_related(None)`` to opt out for narrow queries.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'infocard_type',
+            'subtype',
+            'department',
+            'owner',
+            'previous_version',
+            'superseded_by',
+            'locked_by',
+            'cancelled_by',
+        )
+
+
 class Document(AuditedModel):
     """
     Core Document Control module for pharmaceutical/medical device EQMS.
@@ -669,6 +1020,20 @@ class Document(AuditedModel):
         related_name='documents',
         help_text="Document classification type (SOP, Form, Work Instruction, etc.)"
     )
+    infocard_prefix = models.CharField(
+        max_length=10,
+        blank=True,
+        default='',
+        editable=False,
+        help_text="Copy of infocard_type.prefix, kept in step on save and on prefix changes"
+    )
+    infocard_type_name = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        editable=False,
+        help_text="Copy of infocard_type.name, kept in step on save and on renames"
+    )
     subtype = models.ForeignKey(
         DocumentSubType,
         on_delete=models.SET_NULL,
@@ -686,6 +1051,13 @@ class Document(AuditedModel):
         related_name='documents',
         help_text="Department responsible for this document"
     )
+    department_name = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Copy of department.name, kept in step on save and on renames"
+    )
     owner = models.ForeignKey(
         User,
         on_delete=models.SET_NULL,
@@ -693,6 +1065,13 @@ class Document(AuditedModel):
         related_name='owned_documents',
         help_text="Document owner responsible for maintenance and updates"
     )
+    owner_username = models.CharField(
+        max_length=150,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Copy of owner.username, kept in step on save and on renames"
+    )
     business_unit = models.CharField(
         max_length=100,
         blank=True,
@@ -851,6 +1230,33 @@ class Document(AuditedModel):
         help_text="Workflow category determining approval requirements"
     )
 
+    # --- DENORMALIZED RELATIONSHIP STATE ---
+    # Maintained by signals on DocumentCheckout / DocumentVersion /
+    # DocumentApprover so list views can read them without extra queries.
+    current_checkout = models.OneToOneField(
+        'DocumentCheckout',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        help_text="Currently active checkout, if any"
+    )
+    current_version = models.ForeignKey(
+        'DocumentVersion',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        help_text="Latest DocumentVersion record"
+    )
+    pending_approver_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of approvers with a pending decision"
+    )
+
     # --- FILE FIELDS ---
     file = models.FileField(
         upload_to='documents/%Y/%m/',
@@ -858,10 +1264,11 @@ class Document(AuditedModel):
         blank=True,
         help_text="Primary document file"
     )
-    file_hash = models.CharField(
-        max_length=64,
+    file_hash = models.BinaryField(
+        max_length=32,
+        null=True,
         blank=True,
-        help_text="SHA-256 hash of uploaded file for integrity verification"
+        help_text="Raw 32-byte SHA-256 digest of uploaded file for integrity verification"
     )
     file_size = models.BigIntegerField(
         null=True,
@@ -981,6 +1388,10 @@ class Document(AuditedModel):
         blank=True, default='',
         help_text="Brief document description / abstract"
     )
+    search_vector = SearchVectorField(
+        null=True, blank=True, editable=False,
+        help_text="Weighted tsvector of title/description/keywords/content_plain_text, maintained by a DB trigger"
+    )
 
     # --- FLEXIBLE CUSTOM FIELDS ---
     custom_fields = models.JSONField(
@@ -1024,24 +1435,42 @@ class Document(AuditedModel):
         ordering = ['-created_at']
         verbose_name = "Document"
         verbose_name_plural = "Documents"
+        # document_id (unique), created_at (AuditedModel) and the FKs already
+        # get an index each, so they are not repeated here. Boolean flags are indexed only on the
+        # rare value that is filtered for, in list (-created_at) order.
         indexes = [
-            models.Index(fields=['document_id']),
-            models.Index(fields=['vault_state']),
+            # Also serves plain vault_state filters; the review tasks add a
+            # range on next_review_date within one state
+            models.Index(fields=['vault_state', 'next_review_date'], name='doc_state_review_idx'),
             models.Index(fields=['infocard_type', 'vault_state']),
             models.Index(fields=['department', 'vault_state']),
-            models.Index(fields=['owner']),
-            models.Index(fields=['created_by']),
-            models.Index(fields=['is_locked']),
             models.Index(fields=['next_review_date']),
             models.Index(fields=['released_date']),
-            models.Index(fields=['requires_approval']),
-            models.Index(fields=['requires_training']),
-            models.Index(fields=['is_template']),
-            models.Index(fields=['major_version', 'minor_version']),
+            models.Index(fields=['file_hash'], name='doc_file_hash_idx'),
             models.Index(fields=['title']),
-            models.Index(fields=['-created_at']),
+            models.Index(fields=['-created_at'], name='doc_locked_partial', condition=models.Q(is_locked=True)),
+            models.Index(fields=['-created_at'], name='doc_training_partial', condition=models.Q(requires_training=True)),
+            models.Index(fields=['-created_at'], name='doc_template_partial', condition=models.Q(is_template=True)),
+            # Approval escalation: documents left in review since a cutoff
+            models.Index(fields=['updated_at'], name='doc_inreview_updated', condition=models.Q(vault_state='in_review')),
+            # JSON fields below are only queried by containment (@>), e.g.
+            # content__contains={'type': 'heading'}, so the smaller and faster
+            # jsonb_path_ops opclass is sufficient.
+            GinIndex(fields=['content'], name='doc_content_jsonb_gin', opclasses=['jsonb_path_ops']),
+            GinIndex(fields=['training_applicable_roles'], name='doc_training_roles_gin', opclasses=['jsonb_path_ops']),
+            GinIndex(fields=['subject_keywords'], name='doc_keywords_gin', opclasses=['jsonb_path_ops']),
+            # Custom fields are client-defined and also filtered by key
+            # presence (custom_fields__has_key), which needs the default
+            # jsonb_ops opclass.
+            GinIndex(fields=['custom_fields'], name='doc_custom_fields_gin'),
+            GinIndex(fields=['search_vector'], name='doc_search_gin'),
         ]
     
+    objects = DocumentManager()
+
+    # Columns owned by the relationship sync signals, see sync_denormalized_relations()
+    DENORMALIZED_FIELDS = frozenset({'current_checkout', 'current_version', 'pending_approver_count'})
+
     def __str__(self):
         return f"{self.document_id} - {self.title} (v{self.version_string})"
     
@@ -1049,7 +1478,74 @@ class Document(AuditedModel):
     def version_string(self):
         """Return formatted version string like '2.1'."""
         return f"{self.major_version}.{self.minor_version}"
+
+    @cached_property
+    def created_by_name(self):
+        """Full name of the creator, or None."""
+        return display_name(self.created_by)
+
+    @cached_property
+    def updated_by_name(self):
+        """Full name of the last updater, or None."""
+        return display_name(self.updated_by)
     
+    def _infocard_type(self):
+        """
+        Return this document's infocard type without a query where possible.
+
+        Prefers the instance already attached to this document; otherwise
+        reads it through the lookup cache rather than the lazy FK. The FK is
+        PROTECTed, so a set infocard_type_id always resolves.
+        """
+        if not self.infocard_type_id:
+            return None
+        if Document.infocard_type.is_cached(self):
+            return self.infocard_type
+        from .lookups import get_infocard_type
+        return get_infocard_type(self.infocard_type_id)
+
+    def document_id_prefix(self):
+        """Return the ID prefix for this document's infocard type ('DOC' if none)."""
+        infocard_type = self._infocard_type()
+        return infocard_type.prefix if infocard_type else 'DOC'
+
+    def refresh_denormalized_names(self, fields=None):
+        """
+        Copy the infocard type prefix/name, department name and owner
+        username onto this document's own columns.
+
+        Only the columns derived from the FKs in ``fields`` are refreshed
+        (all of them when ``fields`` is None). Returns the names of the
+        columns that were set.
+        """
+        refreshed = []
+        if fields is None or 'infocard_type' in fields:
+            infocard_type = self._infocard_type()
+            self.infocard_prefix = infocard_type.prefix if infocard_type else 'DOC'
+            self.infocard_type_name = infocard_type.name if infocard_type else ''
+            refreshed += ['infocard_prefix', 'infocard_type_name']
+        if fields is None or 'department' in fields:
+            if self.department_id is None:
+                self.department_name = None
+            elif Document.department.is_cached(self):
+                self.department_name = self.department.name
+            else:
+                self.department_name = Department.objects.filter(
+                    pk=self.department_id
+                ).values_list('name', flat=True).first()
+            refreshed.append('department_name')
+        if fields is None or 'owner' in fields:
+            if self.owner_id is None:
+                self.owner_username = None
+            elif Document.owner.is_cached(self):
+                self.owner_username = self.owner.username
+            else:
+                self.owner_username = User.objects.filter(
+                    pk=self.owner_id
+                ).values_list('username', flat=True).first()
+            refreshed.append('owner_username')
+        return refreshed
+
     def auto_generate_document_id(self):
         """
         Generate unique document ID using infocard type prefix with year and sequence.
@@ -1063,63 +1559,136 @@ class Document(AuditedModel):
         """
         from django.utils import timezone as tz
         year = tz.now().year
+        prefix = self.infocard_prefix or self.document_id_prefix()
 
-        # Use infocard type prefix if available, otherwise fallback to DOC
-        if self.infocard_type_id:
-            try:
-                prefix = self.infocard_type.prefix
-            except DocumentInfocardType.DoesNotExist:
-                prefix = 'DOC'
-        else:
-            prefix = 'DOC'
-
-        # Get the next sequence number for this prefix+year
-        last_doc = Document.objects.filter(
-            document_id__startswith=f'{prefix}-{year}-'
-        ).order_by('-document_id').first()
-
-        if last_doc:
-            try:
-                last_num = int(last_doc.document_id.split('-')[-1])
-                next_num = last_num + 1
-            except (ValueError, IndexError):
-                next_num = 1
-        else:
-            next_num = 1
+        next_num = DocumentIdSequence.next_number(prefix, year)
 
         # Format with leading zeros (4-digit format: 0001, 0002, etc.)
-        document_id = f"{prefix}-{year}-{next_num:04d}"
-
-        # Ensure uniqueness
-        qs = Document.objects.filter(document_id=document_id)
-        if self.pk:
-            qs = qs.exclude(pk=self.pk)
-        while qs.exists():
-            next_num += 1
-            document_id = f"{prefix}-{year}-{next_num:04d}"
-            qs = Document.objects.filter(document_id=document_id)
-            if self.pk:
-                qs = qs.exclude(pk=self.pk)
-
-        return document_id
+        return document_id_template(prefix, year).format(next_num)
     
     def calculate_file_hash(self):
         """
         Calculate SHA-256 hash of uploaded file.
         
         Returns:
-            str: Hexadecimal SHA-256 hash of file content
+            bytes: Raw 32-byte SHA-256 digest of file content (None if no file)
         """
-        if self.file:
-            file_hash = hashlib.sha256()
-            for chunk in self.file.chunks():
-                file_hash.update(chunk)
-            return file_hash.hexdigest()
-        return ""
+        if not self.file:
+            return None
+        return sha256_file(self.file).digest()
+
+    @property
+    def file_hash_hex(self):
+        """Hexadecimal form of file_hash for display and API output."""
+        return bytes(self.file_hash).hex() if self.file_hash else ''
+
+    # Columns rendered by DocumentListSerializer; the large TOASTed content
+    # columns (content, content_html, content_plain_text, description) and the
+    # search vector are left out of list queries.
+    LIST_FIELDS = (
+        'id', 'document_id', 'legacy_document_id', 'title', 'vault_state',
+        'lifecycle_stage', 'major_version', 'minor_version', 'effective_date',
+        'next_review_date', 'created_at', 'current_checkout', 'current_version',
+        'pending_approver_count',
+        'infocard_type', 'infocard_type_name',
+        'department', 'department_name',
+        'owner', 'owner_username',
+    )
+
+    @classmethod
+    def list_queryset(cls):
+        """
+        Queryset for list endpoints: only the columns list rows render. Type,
+        department and owner names come from the denormalized columns, so
+        no table is joined.
+        """
+        return cls.objects.select_related(None).only(*cls.LIST_FIELDS).with_approval_flags()
+
+    # Large columns the detail endpoint leaves unloaded when a sparse
+    # fieldset does not ask for them
+    CONTENT_FIELDS = ('content', 'content_html', 'content_plain_text', 'description', 'custom_fields')
+
+    # Columns the lock and unlock actions change
+    LOCK_FIELDS = ('is_locked', 'locked_by', 'locked_at', 'lock_reason')
+
+    @classmethod
+    def detail_queryset(cls):
+        """
+        Queryset for detail endpoints: all columns, including content. Only
+        the relations DocumentDetailSerializer renders by name are joined;
+        type, department and owner names come from the denormalized
+        columns, and the remaining FKs are rendered as keys.
+        """
+        return cls.objects.select_related(None).select_related(
+            'subtype', 'locked_by', 'created_by', 'updated_by',
+        )
     
+    @classmethod
+    def sync_denormalized_relations(cls, document_id, checkout=False, version=False, approvers=False):
+        """
+        Recompute the denormalized relationship columns for one document,
+        or for each document in a list of ids.
+
+        Runs a single UPDATE with correlated subqueries, bypassing save() and
+        its signals. Callers that bulk-update related rows (which skips
+        signals) must call this explicitly.
+        """
+        from django.db.models import Count, OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+
+        updates = {}
+        if checkout:
+            updates['current_checkout'] = Subquery(
+                DocumentCheckout.objects.filter(
+                    document=OuterRef('pk'), is_active=True
+                ).order_by('-checked_out_at').values('pk')[:1]
+            )
+        if version:
+            updates['current_version'] = Subquery(
+                DocumentVersion.objects.filter(
+                    document=OuterRef('pk')
+                ).order_by('-major_version', '-minor_version', '-pk').values('pk')[:1]
+            )
+        if approvers:
+            updates['pending_approver_count'] = Coalesce(
+                Subquery(
+                    DocumentApprover.objects.filter(
+                        document=OuterRef('pk'), approval_status='pending'
+                    ).values('document').annotate(n=Count('pk')).values('n')[:1]
+                ),
+                Value(0),
+            )
+        if updates:
+            if isinstance(document_id, (list, tuple, set)):
+                documents = cls.objects.filter(pk__in=document_id)
+            else:
+                documents = cls.objects.filter(pk=document_id)
+            documents.update(**updates)
+            from .lookups import invalidate_document_lists
+            transaction.on_commit(invalidate_document_lists)
+
     def get_active_checkout(self):
-        """Get the active checkout for this document, if any."""
-        return self.checkouts.filter(is_active=True).first()
+        """
+        Get the active checkout for this document, if any.
+
+        Memoized on the instance and answered without a query when the
+        current checkout was joined or the checkouts were prefetched. The
+        checkout sync receiver clears the memo when a checkout of this
+        in-memory document is saved or deleted.
+        """
+        try:
+            return self._active_checkout
+        except AttributeError:
+            pass
+        if Document.current_checkout.is_cached(self):
+            checkout = self.current_checkout
+        elif 'checkouts' in getattr(self, '_prefetched_objects_cache', {}):
+            active = [c for c in self.checkouts.all() if c.is_active]
+            checkout = min(active, key=lambda c: c.pk, default=None)
+        else:
+            checkout = self.checkouts.filter(is_active=True).first()
+        self._active_checkout = checkout
+        return checkout
 
     def is_checkout_active(self):
         """Check if document has an active checkout."""
@@ -1147,52 +1716,122 @@ class Document(AuditedModel):
     def get_approval_status(self):
         """
         Get summary of approval status from related DocumentApprover records.
-        
+
+        Uses the counts annotated by ``Document.objects.with_approval_counts()``
+        when available, otherwise aggregates them in a single query.
+
         Returns:
             dict: Summary with pending, approved, rejected counts
         """
-        approvers = self.approvers.all()
+        if not hasattr(self, 'total_approvers'):
+            counts = self.approvers.aggregate(
+                total_approvers=models.Count('id'),
+                **{
+                    f'{status}_count': models.Count('id', filter=models.Q(approval_status=status))
+                    for status in ('pending', 'approved', 'rejected', 'deferred')
+                }
+            )
+        else:
+            counts = vars(self)
         return {
-            'total': approvers.count(),
-            'pending': approvers.filter(approval_status='pending').count(),
-            'approved': approvers.filter(approval_status='approved').count(),
-            'rejected': approvers.filter(approval_status='rejected').count(),
-            'deferred': approvers.filter(approval_status='deferred').count(),
+            'total': counts['total_approvers'],
+            'pending': counts['pending_count'],
+            'approved': counts['approved_count'],
+            'rejected': counts['rejected_count'],
+            'deferred': counts['deferred_count'],
         }
     
     def is_fully_approved(self):
         """Check if all required approvers have approved."""
+        if hasattr(self, 'fully_approved'):
+            return self.fully_approved
         if not self.requires_approval:
             return True
         
-        approvers = self.approvers.all()
-        if not approvers.exists():
-            return False
-        
-        return not approvers.filter(
-            approval_status__in=['pending', 'rejected', 'deferred']
-        ).exists()
+        # One aggregate (or none, if counts are annotated) instead of two EXISTS
+        counts = self.get_approval_status()
+        return counts['total'] > 0 and counts['total'] == counts['approved']
+
+    def transition_to(self, state, user=None, **fields):
+        """
+        Move the document to lifecycle ``state``, writing only what changed.
+
+        Sets vault_state/lifecycle_stage (plus ``updated_by`` and any extra
+        ``fields``) and saves with ``update_fields``, so the UPDATE leaves the
+        large content columns untouched and can be a HOT update. This goes
+        through save() rather than QuerySet.update() because post_save
+        receivers (training assignment, review notifications) react to state
+        changes.
+        """
+        self.vault_state = state
+        self.lifecycle_stage = state
+        update_fields = {'vault_state', 'lifecycle_stage', 'updated_at'}
+        if user is not None:
+            self.updated_by = user
+            update_fields.add('updated_by')
+        for name, value in fields.items():
+            setattr(self, name, value)
+        update_fields.update(fields)
+        self.save(update_fields=sorted(update_fields))
     
     def save(self, *args, **kwargs):
         """
-        Override save to auto-generate document ID and calculate file hash.
+        Override save to auto-generate document ID and schedule file hashing.
+
+        The SHA-256 hash is computed by the ``process_document_file`` Celery
+        task once the transaction commits, so uploads do not block on hashing.
         """
+        # Refresh the denormalized names whenever their FK may have changed
+        update_fields = kwargs.get('update_fields')
+        refreshed = self.refresh_denormalized_names(update_fields)
+        if update_fields is not None and refreshed:
+            kwargs['update_fields'] = {*update_fields, *refreshed}
+
         # Auto-generate document ID if not set
         if not self.document_id:
             self.document_id = self.auto_generate_document_id()
         
-        # Calculate file hash if file is present
-        if self.file and not self.file_hash:
-            self.file_hash = self.calculate_file_hash()
-            if self.file.size:
-                self.file_size = self.file.size
-        
-        # Set original filename if not set
-        if self.file and not self.original_filename:
-            self.original_filename = self.file.name
+        # Record size and original filename; use the digest taken while the
+        # file was uploaded, otherwise defer the hash
+        needs_hash = False
+        if self.file:
+            uploaded_digest = uploaded_sha256(self.file)
+            if uploaded_digest is not None:
+                self.file_hash = uploaded_digest
+            elif not self.file._committed:
+                # Newly assigned file with no streamed digest; any recorded
+                # hash belongs to the file it replaces
+                self.file_hash = None
+            if not self.file_hash:
+                needs_hash = True
+                if self.file.size:
+                    self.file_size = self.file.size
+            if not self.original_filename:
+                self.original_filename = self.file.name
         
+        # Never write the signal-maintained columns from a possibly stale
+        # in-memory instance.
+        if kwargs.get('update_fields') is None and not args and not self._state.adding:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.DENORMALIZED_FIELDS
+            ]
+
         super().save(*args, **kwargs)
 
+        if needs_hash:
+            pk = self.pk
+            transaction.on_commit(lambda: _dispatch_file_processing(pk))
+
+
+def _dispatch_file_processing(document_pk):
+    """Queue background hashing; a broker outage must not fail the request."""
+    from .tasks import process_document_file
+    try:
+        process_document_file.delay(document_pk)
+    except Exception as e:
+        logger.warning(f"Could not queue file processing for document {document_pk}: {e}")
+
 
 class DocumentComment(AuditedModel):
     """
@@ -1271,6 +1910,15 @@ class DocumentComment(AuditedModel):
         prefix = f"[{self.get_comment_type_display()}]"
         return f"{prefix} {self.author.username} on {self.document.document_id}: {self.text[:50]}"
 
+    # Both are overridden by same-named annotations on the comment lists
+    @cached_property
+    def author_name(self):
+        return display_name(self.author)
+
+    @cached_property
+    def reply_count(self):
+        return self.replies.count()
+
 
 class DocumentSuggestion(AuditedModel):
     """
@@ -1355,6 +2003,11 @@ class DocumentSuggestion(AuditedModel):
         action = self.get_suggestion_type_display()
         return f"[{action}] {self.author.username} on {self.document.document_id}: {self.original_text[:30]}→{self.suggested_text[:30]}"
 
+    # Overridden by the same-named annotation on the suggestions list
+    @cached_property
+    def author_name(self):
+        return display_name(self.author)
+
 
 class DocumentAcknowledgment(AuditedModel):
     """
@@ -1394,7 +2047,6 @@ class DocumentAcknowledgment(AuditedModel):
         verbose_name = 'Document Acknowledgment'
         verbose_name_plural = 'Document Acknowledgments'
         indexes = [
-            models.Index(fields=['document', 'user']),
             models.Index(fields=['acknowledged_at']),
         ]
 
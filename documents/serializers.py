@@ -9,8 +9,13 @@ Comprehensive DRF serializers for document management including:
 - Lifecycle transitions and validation
 """
 
+import copy
+
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
 from .models import (
     DocumentInfocardType,
     DocumentSubType,
@@ -23,13 +28,82 @@ from .models import (
     DocumentChangeApproval,
     Document,
 )
+from .lookups import get_infocard_type, get_subtype
+
+
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """PrimaryKeyRelatedField that resolves input through a cached lookup."""
+
+    def __init__(self, lookup, **kwargs):
+        self.lookup = lookup
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return self.lookup(data)
+        except ObjectDoesNotExist:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class rather than per instance.
+
+    ModelSerializer.get_fields() introspects the model every time a
+    serializer is instantiated, but the result depends only on the class.
+    Each instance gets copies of the cached fields: plain fields are copied
+    shallowly (bind() only sets attributes on the copy) and nested
+    serializers deeply, so each is bound under its own parent and context.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return {
+            name: copy.deepcopy(field) if isinstance(field, serializers.BaseSerializer) else copy.copy(field)
+            for name, field in fields.items()
+        }
+
+
+class DynamicFieldsMixin:
+    """
+    Sparse fieldsets for reads: ``?fields=id,title`` renders only the named
+    fields and ``?omit=content_html,versions`` drops fields. Only the
+    top-level serializer of a GET request is narrowed, so writes always
+    validate against the full field set. Unknown names are ignored.
+    """
+
+    @staticmethod
+    def field_selection(request):
+        """Return a predicate telling whether ``request`` asks for a field."""
+        def names(param):
+            value = request.query_params.get(param, '')
+            return {name.strip() for name in value.split(',') if name.strip()}
+
+        only, omit = names('fields'), names('omit')
+        return lambda name: (not only or name in only) and name not in omit
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        if request is None or request.method != 'GET' or self.parent is not None:
+            return fields
+        wanted = self.field_selection(request)
+        return {name: field for name, field in fields.items() if wanted(name)}
 
 
 # ============================================================================
 # DOCUMENT TYPE SERIALIZERS
 # ============================================================================
 
-class DocumentInfocardTypeSerializer(serializers.ModelSerializer):
+class DocumentInfocardTypeSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DocumentInfocardType with all fields."""
     
     class Meta:
@@ -48,7 +122,7 @@ class DocumentInfocardTypeSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'created_by', 'updated_at', 'updated_by']
 
 
-class DocumentSubTypeSerializer(serializers.ModelSerializer):
+class DocumentSubTypeSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DocumentSubType with read-only infocard type name."""
     
     infocard_type_name = serializers.CharField(
@@ -77,7 +151,7 @@ class DocumentSubTypeSerializer(serializers.ModelSerializer):
 # CHECKOUT & APPROVER SERIALIZERS
 # ============================================================================
 
-class DocumentCheckoutSerializer(serializers.ModelSerializer):
+class DocumentCheckoutSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DocumentCheckout with read-only checked out by username."""
     
     checked_out_by_username = serializers.CharField(
@@ -100,7 +174,7 @@ class DocumentCheckoutSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'checked_out_at']
 
 
-class DocumentApproverSerializer(serializers.ModelSerializer):
+class DocumentApproverSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DocumentApprover with read-only approver username."""
 
     approver_username = serializers.CharField(
@@ -125,14 +199,47 @@ class DocumentApproverSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'approved_at']
 
+    # Columns read by rows_from_values()
+    VALUES_FIELDS = (
+        'id', 'document', 'approver', 'approver__username', 'approval_status',
+        'role_required', 'sequence', 'comments', 'approved_at', 'signature',
+        'is_final_approver',
+    )
+
+    @classmethod
+    def rows_from_values(cls, rows):
+        """Render ``values(*VALUES_FIELDS)`` rows as this serializer renders instances."""
+        datetime = serializers.DateTimeField().to_representation
+        return [
+            {
+                'id': r['id'],
+                'document': r['document'],
+                'approver': r['approver'],
+                'approver_username': r['approver__username'],
+                'approval_status': r['approval_status'],
+                'role_required': r['role_required'],
+                'sequence': r['sequence'],
+                'comments': r['comments'],
+                'approved_at': datetime(r['approved_at']),
+                'signature': r['signature'],
+                'is_final_approver': r['is_final_approver'],
+            }
+            for r in rows
+        ]
+
 
 class DocumentCollaboratorSerializer(serializers.ModelSerializer):
-    """Serializer for DocumentCollaborator with user and department details."""
+    """
+    Serializer for DocumentCollaborator with user and department details.
+
+    Expects instances from DocumentCollaborator.objects.with_user_details(),
+    which computes ``full_name`` and ``department`` in the query.
+    """
     user_id = serializers.IntegerField(source='user.id', read_only=True)
     username = serializers.CharField(source='user.username', read_only=True)
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.CharField(read_only=True)
     email = serializers.EmailField(source='user.email', read_only=True)
-    department = serializers.SerializerMethodField()
+    department = serializers.CharField(read_only=True)
 
     class Meta:
         model = DocumentCollaborator
@@ -143,21 +250,12 @@ class DocumentCollaboratorSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'added_by', 'added_at', 'updated_at']
 
-    def get_full_name(self, obj):
-        return f"{obj.user.first_name} {obj.user.last_name}".strip() or obj.user.username
-
-    def get_department(self, obj):
-        profile = getattr(obj.user, 'profile', None)
-        if profile and profile.department:
-            return profile.department.name
-        return ''
-
 
 # ============================================================================
 # SNAPSHOT & VERSION SERIALIZERS
 # ============================================================================
 
-class DocumentSnapshotSerializer(serializers.ModelSerializer):
+class DocumentSnapshotSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DocumentSnapshot with read-only immutable fields."""
 
     class Meta:
@@ -174,10 +272,32 @@ class DocumentSnapshotSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class DocumentVersionSerializer(serializers.ModelSerializer):
+class DocumentSnapshotListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Snapshot list rows without the frozen payload.
+
+    ``snapshot_blob`` is the SHA-256 of the payload, so clients can tell
+    identical snapshots apart without fetching them.
+    """
+
+    class Meta:
+        model = DocumentSnapshot
+        fields = [
+            'id',
+            'document',
+            'version_string',
+            'snapshot_type',
+            'snapshot_blob',
+            'created_at',
+            'created_by',
+        ]
+        read_only_fields = fields
+
+
+class DocumentVersionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DocumentVersion with computed version string."""
 
-    version_string = serializers.SerializerMethodField()
+    version_string = serializers.CharField(read_only=True)
 
     class Meta:
         model = DocumentVersion
@@ -199,16 +319,43 @@ class DocumentVersionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'created_by', 'updated_at', 'updated_by']
 
-    def get_version_string(self, obj):
-        """Return formatted version string like '2.1'."""
-        return f"{obj.major_version}.{obj.minor_version}"
+    # Columns read by rows_from_values()
+    VALUES_FIELDS = (
+        'id', 'document', 'major_version', 'minor_version', 'change_type',
+        'is_major_change', 'change_summary', 'snapshot_data', 'released_date',
+        'created_at', 'created_by', 'updated_at', 'updated_by',
+    )
+
+    @classmethod
+    def rows_from_values(cls, rows):
+        """Render ``values(*VALUES_FIELDS)`` rows as this serializer renders instances."""
+        datetime = serializers.DateTimeField().to_representation
+        return [
+            {
+                'id': r['id'],
+                'document': r['document'],
+                'major_version': r['major_version'],
+                'minor_version': r['minor_version'],
+                'version_string': f"{r['major_version']}.{r['minor_version']}",
+                'change_type': r['change_type'],
+                'is_major_change': r['is_major_change'],
+                'change_summary': r['change_summary'],
+                'snapshot_data': r['snapshot_data'],
+                'released_date': datetime(r['released_date']),
+                'created_at': datetime(r['created_at']),
+                'created_by': r['created_by'],
+                'updated_at': datetime(r['updated_at']),
+                'updated_by': r['updated_by'],
+            }
+            for r in rows
+        ]
 
 
 # ============================================================================
 # CHANGE ORDER & APPROVAL SERIALIZERS
 # ============================================================================
 
-class DocumentChangeOrderSerializer(serializers.ModelSerializer):
+class DocumentChangeOrderSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DocumentChangeOrder."""
 
     class Meta:
@@ -233,7 +380,7 @@ class DocumentChangeOrderSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class DocumentChangeApprovalSerializer(serializers.ModelSerializer):
+class DocumentChangeApprovalSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DocumentChangeApproval."""
 
     class Meta:
@@ -253,27 +400,46 @@ class DocumentChangeApprovalSerializer(serializers.ModelSerializer):
 # DOCUMENT SERIALIZERS
 # ============================================================================
 
-class DocumentListSerializer(serializers.ModelSerializer):
-    """Compact serializer for document lists."""
-
-    infocard_type_name = serializers.CharField(
-        source='infocard_type.name',
-        read_only=True
-    )
-    version_string = serializers.SerializerMethodField()
-    department_name = serializers.CharField(
-        source='department.name',
-        read_only=True,
-        default=None
-    )
-    owner_username = serializers.CharField(
-        source='owner.username',
-        read_only=True,
-        default=None
-    )
+class DocumentListRowsSerializer(serializers.ListSerializer):
+    """
+    ``many=True`` serializer for DocumentListSerializer that renders
+    ``values()`` rows in one pass instead of running the child serializer
+    per model instance.
+
+    Querysets (which must come from Document.list_queryset()) are read with
+    ``values(*VALUES_FIELDS)``; rows already fetched that way, such as a
+    paginated page, are rendered as they are. Lists of model instances fall
+    back to the per-row path.
+    """
+
+    def to_representation(self, data):
+        if isinstance(data, (models.Manager, models.QuerySet)):
+            data = data.all().values(*self.child.VALUES_FIELDS)
+        rows = list(data)
+        if rows and not isinstance(rows[0], dict):
+            return super().to_representation(rows)
+        return self.child.rows_from_values(rows)
+
+
+class DocumentListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Compact serializer for document lists.
+
+    Type, department and owner names are read from the denormalized
+    columns on Document rather than through the foreign keys.
+    """
+
+    infocard_type_name = serializers.CharField(read_only=True)
+    version_string = serializers.CharField(read_only=True)
+    department_name = serializers.CharField(read_only=True)
+    owner_username = serializers.CharField(read_only=True)
+    # Annotated by Document.list_queryset()
+    has_approvers = serializers.BooleanField(read_only=True)
+    fully_approved = serializers.BooleanField(read_only=True)
     
     class Meta:
         model = Document
+        list_serializer_class = DocumentListRowsSerializer
         fields = [
             'id',
             'document_id',
@@ -288,73 +454,116 @@ class DocumentListSerializer(serializers.ModelSerializer):
             'department_name',
             'owner',
             'owner_username',
+            'current_checkout',
+            'current_version',
+            'pending_approver_count',
+            'has_approvers',
+            'fully_approved',
             'created_at',
         ]
+        # List rows are never written; read-only FKs skip the queryset
+        # PrimaryKeyRelatedField would otherwise carry for validation.
         read_only_fields = [
             'id',
             'document_id',
             'legacy_document_id',
+            'infocard_type',
+            'department',
+            'owner',
             'version_string',
             'infocard_type_name',
             'department_name',
             'owner_username',
+            'current_checkout',
+            'current_version',
+            'pending_approver_count',
             'created_at',
         ]
     
-    def get_version_string(self, obj):
-        """Return formatted version string like '2.1'."""
-        return f"{obj.major_version}.{obj.minor_version}"
+    # Columns read by rows_from_values()
+    VALUES_FIELDS = (
+        'id', 'document_id', 'legacy_document_id', 'title',
+        'infocard_type', 'infocard_type_name', 'vault_state', 'lifecycle_stage',
+        'major_version', 'minor_version', 'department', 'department_name',
+        'owner', 'owner_username', 'current_checkout', 'current_version',
+        'pending_approver_count', 'has_approvers', 'fully_approved', 'created_at',
+    )
+
+    @classmethod
+    def rows_from_values(cls, rows):
+        """
+        Render ``queryset.values(*VALUES_FIELDS)`` rows as this serializer
+        would render the model instances, without instantiating them.
+
+        For large list pages, building Document instances and walking the
+        field objects per row dominates the response time.
+        """
+        created_at = serializers.DateTimeField().to_representation
+        return [
+            {
+                'id': r['id'],
+                'document_id': r['document_id'],
+                'legacy_document_id': r['legacy_document_id'],
+                'title': r['title'],
+                'infocard_type': r['infocard_type'],
+                'infocard_type_name': r['infocard_type_name'],
+                'vault_state': r['vault_state'],
+                'lifecycle_stage': r['lifecycle_stage'],
+                'version_string': f"{r['major_version']}.{r['minor_version']}",
+                'department': r['department'],
+                'department_name': r['department_name'],
+                'owner': r['owner'],
+                'owner_username': r['owner_username'],
+                'current_checkout': r['current_checkout'],
+                'current_version': r['current_version'],
+                'pending_approver_count': r['pending_approver_count'],
+                'has_approvers': r['has_approvers'],
+                'fully_approved': r['fully_approved'],
+                'created_at': created_at(r['created_at']),
+            }
+            for r in rows
+        ]
 
 
-class DocumentDetailSerializer(serializers.ModelSerializer):
-    """Full document serializer with nested relationships."""
+class DocumentDetailSerializer(DynamicFieldsMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Full document serializer with nested relationships.
 
-    infocard_type_name = serializers.CharField(
-        source='infocard_type.name',
-        read_only=True
-    )
+    Type, department and owner names are read from the denormalized
+    columns on Document, as in DocumentListSerializer.
+    """
+
+    infocard_type_name = serializers.CharField(read_only=True)
     subtype_name = serializers.CharField(
         source='subtype.name',
         read_only=True,
         default=None
     )
-    department_name = serializers.CharField(
-        source='department.name',
-        read_only=True,
-        default=None
-    )
-    owner_username = serializers.CharField(
-        source='owner.username',
-        read_only=True,
-        default=None
-    )
+    department_name = serializers.CharField(read_only=True)
+    owner_username = serializers.CharField(read_only=True)
     locked_by_username = serializers.CharField(
         source='locked_by.username',
         read_only=True,
         default=None
     )
+    # Stored as raw bytes; exposed as hex for API compatibility
+    file_hash = serializers.CharField(source='file_hash_hex', read_only=True)
     # User detail fields for Created By / Updated By display
     created_by_username = serializers.CharField(
         source='created_by.username',
         read_only=True,
         default=None
     )
-    created_by_name = serializers.SerializerMethodField()
+    created_by_name = serializers.CharField(read_only=True)
     updated_by_username = serializers.CharField(
         source='updated_by.username',
         read_only=True,
         default=None
     )
-    updated_by_name = serializers.SerializerMethodField()
-    version_string = serializers.SerializerMethodField()
-    versions = DocumentVersionSerializer(
-        many=True,
-        read_only=True
-    )
-    approvers = DocumentApproverSerializer(
-        many=True,
-        read_only=True
-    )
+    updated_by_name = serializers.CharField(read_only=True)
+    version_string = serializers.CharField(read_only=True)
+    versions = serializers.SerializerMethodField()
+    approvers = serializers.SerializerMethodField()
     current_checkout = serializers.SerializerMethodField()
     approval_status = serializers.SerializerMethodField()
     
@@ -468,27 +677,23 @@ class DocumentDetailSerializer(serializers.ModelSerializer):
             'updated_by',
         ]
 
-    def get_version_string(self, obj):
-        """Return formatted version string like '2.1'."""
-        return f"{obj.major_version}.{obj.minor_version}"
+    # Versions and approvers are read as flat rows rather than through nested
+    # serializers, which build and walk a field set per row.
 
-    def get_created_by_name(self, obj):
-        """Return full name of the creator."""
-        if obj.created_by:
-            name = f"{obj.created_by.first_name} {obj.created_by.last_name}".strip()
-            return name or obj.created_by.username
-        return None
+    @extend_schema_field(DocumentVersionSerializer(many=True))
+    def get_versions(self, obj):
+        rows = obj.versions.values(*DocumentVersionSerializer.VALUES_FIELDS)
+        return DocumentVersionSerializer.rows_from_values(rows)
 
-    def get_updated_by_name(self, obj):
-        """Return full name of the last updater."""
-        if obj.updated_by:
-            name = f"{obj.updated_by.first_name} {obj.updated_by.last_name}".strip()
-            return name or obj.updated_by.username
-        return None
+    @extend_schema_field(DocumentApproverSerializer(many=True))
+    def get_approvers(self, obj):
+        rows = obj.approvers.order_by('sequence').values(*DocumentApproverSerializer.VALUES_FIELDS)
+        return DocumentApproverSerializer.rows_from_values(rows)
 
     def get_current_checkout(self, obj):
         """Get the current active checkout if exists."""
-        checkout = obj.get_active_checkout()
+        # current_checkout is kept pointing at the active checkout by signals
+        checkout = obj.current_checkout
         if checkout:
             return DocumentCheckoutSerializer(checkout).data
         return None
@@ -501,6 +706,17 @@ class DocumentDetailSerializer(serializers.ModelSerializer):
 class DocumentCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating new documents."""
 
+    infocard_type = CachedPrimaryKeyRelatedField(
+        lookup=get_infocard_type,
+        queryset=DocumentInfocardType.objects.all(),
+    )
+    subtype = CachedPrimaryKeyRelatedField(
+        lookup=get_subtype,
+        queryset=DocumentSubType.objects.all(),
+        required=False,
+        allow_null=True,
+    )
+
     class Meta:
         model = Document
         fields = [
@@ -543,15 +759,15 @@ class DocumentCreateSerializer(serializers.ModelSerializer):
 # DOCUMENT COMMENT SERIALIZERS
 # ============================================================================
 
-class DocumentCommentSerializer(serializers.ModelSerializer):
+class DocumentCommentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Full comment serializer with author info and replies."""
     author_username = serializers.CharField(source='author.username', read_only=True)
-    author_name = serializers.SerializerMethodField()
+    author_name = serializers.CharField(read_only=True)
     resolved_by_username = serializers.CharField(
         source='resolved_by.username', read_only=True, default=None
     )
     replies = serializers.SerializerMethodField()
-    reply_count = serializers.SerializerMethodField()
+    reply_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         from .models import DocumentComment
@@ -570,23 +786,20 @@ class DocumentCommentSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at',
         ]
 
-    def get_author_name(self, obj):
-        return f"{obj.author.first_name} {obj.author.last_name}".strip() or obj.author.username
-
     def get_replies(self, obj):
-        if obj.parent is not None:
+        if obj.parent_id is not None:
             return []  # Don't nest infinitely
-        replies = obj.replies.select_related('author', 'resolved_by').order_by('created_at')
+        # Prefetched by the comments list as ``thread_replies``
+        replies = getattr(obj, 'thread_replies', None)
+        if replies is None:
+            replies = obj.replies.select_related('author', 'resolved_by').order_by('created_at')
         return DocumentCommentSerializer(replies, many=True).data
 
-    def get_reply_count(self, obj):
-        return obj.replies.count()
-
 
 class DocumentSuggestionSerializer(serializers.ModelSerializer):
     """Serializer for track changes / suggestions."""
     author_username = serializers.CharField(source='author.username', read_only=True)
-    author_name = serializers.SerializerMethodField()
+    author_name = serializers.CharField(read_only=True)
     reviewed_by_username = serializers.CharField(
         source='reviewed_by.username', read_only=True, default=None
     )
@@ -607,9 +820,6 @@ class DocumentSuggestionSerializer(serializers.ModelSerializer):
             'document_version', 'created_at', 'updated_at',
         ]
 
-    def get_author_name(self, obj):
-        return f"{obj.author.first_name} {obj.author.last_name}".strip() or obj.author.username
-
 
 class DocumentContentUpdateSerializer(serializers.Serializer):
     """Serializer for saving document content from the TipTap editor."""
@@ -673,3 +883,22 @@ class LifecycleTransitionSerializer(serializers.Serializer):
         required=True,
         help_text="User password for electronic signature"
     )
+
+
+class BulkDocumentOperationSerializer(serializers.Serializer):
+    """Serializer for one item of a bulk document action."""
+
+    OPERATIONS = ('lock', 'unlock', 'approve')
+
+    id = serializers.IntegerField()
+    op = serializers.ChoiceField(choices=OPERATIONS)
+    payload = serializers.DictField(
+        required=False,
+        default=dict,
+        help_text="lock: {reason}; approve: {signature, comment}"
+    )
+
+    def validate(self, attrs):
+        if attrs['op'] == 'approve' and not attrs['payload'].get('signature'):
+            raise serializers.ValidationError({'payload': 'Signature is required'})
+        return attrs
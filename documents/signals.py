@@ -1,48 +1,32 @@
-import hashlib
-from django.db.models.signals import pre_save, post_save
-from django.dispatch import receiver
-from documents.models import Document, DocumentVersion
+import logging
 
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, pre_delete, post_delete
+from django.db import transaction
+from django.dispatch import receiver
+from documents.models import (
+    Document, DocumentVersion, DocumentCheckout, DocumentApprover,
+    DocumentInfocardType, DocumentSubType,
+)
+from documents import lookups
+from training.models import TrainingAssignment
+from users.models import Department
 
-@receiver(pre_save, sender=Document)
-def calculate_document_file_hash(sender, instance, **kwargs):
-    """Calculate SHA-256 hash of the uploaded file."""
-    if instance.file:
-        if instance.file.size > 0:
-            # Read file content and calculate hash
-            instance.file.seek(0)
-            file_hash = hashlib.sha256(instance.file.read()).hexdigest()
-            instance.file_hash = file_hash
-            instance.file.seek(0)
+logger = logging.getLogger(__name__)
 
 
-@receiver(post_save, sender=Document)
+@receiver(post_save, sender=Document, dispatch_uid='documents.create_initial_document_version')
 def create_initial_document_version(sender, instance, created, **kwargs):
     """Create initial document version when document is created."""
     if created:
-        DocumentVersion.objects.create(
-            document=instance,
-            major_version=instance.major_version,
-            minor_version=instance.minor_version,
-            created_by=instance.owner or instance.created_by,
-            updated_by=instance.owner or instance.created_by,
-            change_summary='Initial version',
-            snapshot_data={
-                'title': instance.title,
-                'vault_state': instance.vault_state,
-                'created_at': str(instance.created_at) if instance.created_at else None,
-            },
-        )
-
-
-@receiver(post_save, sender=Document)
+        DocumentVersion.initial_for(instance).save()
+
+
+@receiver(post_save, sender=Document, dispatch_uid='documents.auto_assign_training_on_approval')
 def auto_assign_training_on_approval(sender, instance, **kwargs):
     """Auto-assign training when document enters training_period state."""
     if instance.vault_state == 'training_period' and instance.requires_training:
         try:
-            from training.models import TrainingAssignment
-            from django.contrib.auth.models import User
-
             # Get applicable roles
             applicable_roles = instance.training_applicable_roles or []
 
@@ -72,28 +56,105 @@ def auto_assign_training_on_approval(sender, instance, **kwargs):
                     }
                 )
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Auto-assign training failed: {e}")
-
-
-@receiver(post_save, sender=Document)
-def notify_periodic_review_due(sender, instance, **kwargs):
-    """Send notification when document is approaching review date."""
-    if instance.vault_state == 'effective' and instance.next_review_date:
-        from django.utils import timezone
-        from datetime import timedelta
-        today = timezone.now().date()
-        warning_date = instance.next_review_date - timedelta(days=30)
-
-        if today >= warning_date and today < instance.next_review_date:
-            try:
-                from core.notifications import NotificationService
-                NotificationService.send_notification(
-                    user=instance.owner,
-                    title=f'Periodic Review Due: {instance.document_id}',
-                    message=f'Document "{instance.title}" is due for periodic review on {instance.next_review_date}.',
-                    notification_type='review_reminder',
-                    related_object=instance,
-                )
-            except Exception:
-                pass
+            logger.warning(f"Auto-assign training failed: {e}")
+
+
+@receiver(post_save, sender=DocumentCheckout, dispatch_uid='documents.sync_document_current_checkout')
+@receiver(post_delete, sender=DocumentCheckout, dispatch_uid='documents.sync_document_current_checkout')
+def sync_document_current_checkout(sender, instance, **kwargs):
+    """Keep Document.current_checkout in step with its checkouts."""
+    Document.sync_denormalized_relations(instance.document_id, checkout=True)
+    if DocumentCheckout.document.is_cached(instance):
+        # Drop what Document.get_active_checkout() answers from, so the
+        # next call on this instance queries again.
+        document = instance.document
+        document.__dict__.pop('_active_checkout', None)
+        document._state.fields_cache.pop('current_checkout', None)
+        getattr(document, '_prefetched_objects_cache', {}).pop('checkouts', None)
+
+
+@receiver(post_save, sender=DocumentVersion, dispatch_uid='documents.sync_document_current_version')
+@receiver(post_delete, sender=DocumentVersion, dispatch_uid='documents.sync_document_current_version')
+def sync_document_current_version(sender, instance, **kwargs):
+    """Keep Document.current_version pointing at the latest version."""
+    Document.sync_denormalized_relations(instance.document_id, version=True)
+
+
+@receiver(post_save, sender=DocumentApprover, dispatch_uid='documents.sync_document_pending_approvers')
+@receiver(post_delete, sender=DocumentApprover, dispatch_uid='documents.sync_document_pending_approvers')
+def sync_document_pending_approvers(sender, instance, **kwargs):
+    """Keep Document.pending_approver_count in step with approver decisions."""
+    Document.sync_denormalized_relations(instance.document_id, approvers=True)
+
+
+@receiver(post_save, sender=DocumentInfocardType, dispatch_uid='documents.invalidate_infocard_type_cache')
+@receiver(post_delete, sender=DocumentInfocardType, dispatch_uid='documents.invalidate_infocard_type_cache')
+def invalidate_infocard_type_cache(sender, instance, **kwargs):
+    """Drop cached infocard type lookups once the change is committed."""
+    pk = instance.pk
+    transaction.on_commit(lambda: lookups.invalidate_infocard_type(pk))
+
+
+def _invalidate_document_lists():
+    transaction.on_commit(lookups.invalidate_document_lists)
+
+
+@receiver(post_save, sender=DocumentInfocardType, dispatch_uid='documents.sync_document_infocard_prefix')
+def sync_document_infocard_prefix(sender, instance, created, **kwargs):
+    """Carry a prefix or name change over to Document.infocard_prefix/infocard_type_name."""
+    if not created and Document.objects.filter(infocard_type=instance).exclude(
+        infocard_prefix=instance.prefix, infocard_type_name=instance.name
+    ).update(infocard_prefix=instance.prefix, infocard_type_name=instance.name):
+        _invalidate_document_lists()
+
+
+@receiver(post_save, sender=Department, dispatch_uid='documents.sync_document_department_name')
+def sync_document_department_name(sender, instance, created, update_fields=None, **kwargs):
+    """Carry a department rename over to Document.department_name."""
+    if created or (update_fields is not None and 'name' not in update_fields):
+        return
+    if Document.objects.filter(department=instance).exclude(
+        department_name=instance.name
+    ).update(department_name=instance.name):
+        _invalidate_document_lists()
+
+
+@receiver(post_save, sender=User, dispatch_uid='documents.sync_document_owner_username')
+def sync_document_owner_username(sender, instance, created, update_fields=None, **kwargs):
+    """Carry a username change over to Document.owner_username."""
+    # Logins save with update_fields=['last_login']; skip those
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
+    if Document.objects.filter(owner=instance).exclude(
+        owner_username=instance.username
+    ).update(owner_username=instance.username):
+        _invalidate_document_lists()
+
+
+@receiver(pre_delete, sender=Department, dispatch_uid='documents.clear_document_department_name')
+def clear_document_department_name(sender, instance, **kwargs):
+    """Department FKs are SET_NULL on delete without save(); clear the copied name too."""
+    if Document.objects.filter(department=instance).update(department_name=None):
+        _invalidate_document_lists()
+
+
+@receiver(pre_delete, sender=User, dispatch_uid='documents.clear_document_owner_username')
+def clear_document_owner_username(sender, instance, **kwargs):
+    """Owner FKs are SET_NULL on delete without save(); clear the copied username too."""
+    if Document.objects.filter(owner=instance).update(owner_username=None):
+        _invalidate_document_lists()
+
+
+@receiver(post_save, sender=Document, dispatch_uid='documents.invalidate_document_list_cache')
+@receiver(post_delete, sender=Document, dispatch_uid='documents.invalidate_document_list_cache')
+def invalidate_document_list_cache(sender, instance, **kwargs):
+    """Retire cached document list pages once a document change is committed."""
+    _invalidate_document_lists()
+
+
+@receiver(post_save, sender=DocumentSubType, dispatch_uid='documents.invalidate_subtype_cache')
+@receiver(post_delete, sender=DocumentSubType, dispatch_uid='documents.invalidate_subtype_cache')
+def invalidate_subtype_cache(sender, instance, **kwargs):
+    """Drop cached subtype lookups once the change is committed."""
+    pk = instance.pk
+    transaction.on_commit(lambda: lookups.invalidate_subtype(pk))
@@ -2,38 +2,95 @@
 Celery periodic tasks for document lifecycle management.
 """
 from celery import shared_task
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, F, Q
 from django.utils import timezone
+from collections import defaultdict
 from datetime import timedelta
 import logging
 
+try:
+    from dateutil.relativedelta import relativedelta
+except ImportError:
+    relativedelta = None
+
+from core.notifications import NotificationService
+from documents.lookups import invalidate_document_lists
+from documents.models import Document, DocumentApprover
+
 logger = logging.getLogger(__name__)
 
+# Document columns the review notices read; the owner is joined alongside
+REVIEW_NOTICE_FIELDS = ('id', 'document_id', 'title', 'next_review_date', 'owner')
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def process_document_file(self, document_id):
+    """
+    Compute integrity metadata for a document's uploaded file.
+
+    Runs off the request thread after the upload transaction commits. The
+    result is written with a targeted UPDATE so Document.save() and its
+    signals are not re-triggered; retries are idempotent.
+    """
+
+    doc = Document.objects.select_related(None).filter(pk=document_id).only('id', 'file').first()
+    if doc is None or not doc.file:
+        return f"Document {document_id} has no file to process"
+
+    try:
+        file_hash = doc.calculate_file_hash()
+        file_size = doc.file.size
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+    Document.objects.filter(pk=document_id).update(file_hash=file_hash, file_size=file_size)
+    return f"Hashed file for document {document_id}"
+
+
+@shared_task
+def hash_pending_document_files(limit=500):
+    """
+    Queue hashing for documents whose file has no recorded hash yet.
+
+    Uploads queue process_document_file themselves; this sweep catches the
+    ones whose dispatch was lost (e.g. broker unavailable at commit time).
+    """
+
+    pending = list(
+        Document.objects.select_related(None)
+        .filter(file_hash__isnull=True, file__isnull=False)
+        .exclude(file='')
+        .values_list('pk', flat=True)[:limit]
+    )
+    for pk in pending:
+        process_document_file.delay(pk)
+
+    return f"Queued hashing for {len(pending)} documents"
+
 
 @shared_task
 def check_overdue_reviews():
     """Check for documents past their review date and send notifications."""
-    from documents.models import Document
     today = timezone.now().date()
 
     overdue_docs = Document.objects.filter(
         vault_state='effective',
         next_review_date__lt=today,
-    ).select_related('owner')
-
-    count = 0
-    for doc in overdue_docs:
-        try:
-            from core.notifications import NotificationService
-            NotificationService.send_notification(
-                user=doc.owner,
-                title=f'OVERDUE Review: {doc.document_id}',
-                message=f'Document "{doc.title}" review was due on {doc.next_review_date}. Please initiate a review.',
-                notification_type='review_overdue',
-                related_object=doc,
-            )
-            count += 1
-        except Exception as e:
-            logger.warning(f"Failed to notify for {doc.document_id}: {e}")
+        owner__isnull=False,
+    ).select_related(None).select_related('owner').only(*REVIEW_NOTICE_FIELDS)
+
+    count = NotificationService.create_in_app_notifications(
+        NotificationService.build_in_app_notification(
+            recipient=doc.owner,
+            notification_type='review_overdue',
+            subject=f'OVERDUE Review: {doc.document_id}',
+            message=f'Document "{doc.title}" review was due on {doc.next_review_date}. Please initiate a review.',
+            related_object_type='document',
+            related_object_id=doc.pk,
+        )
+        for doc in overdue_docs.iterator(chunk_size=500)
+    )
 
     return f"Notified {count} overdue document reviews"
 
@@ -41,36 +98,50 @@ def check_overdue_reviews():
 @shared_task
 def check_training_completion():
     """Check if all training is complete for documents in training_period."""
-    from documents.models import Document
-
-    docs_in_training = Document.objects.filter(vault_state='training_period')
 
+    # Documents whose triggered training assignments are all completed,
+    # counted in one grouped query
+    ready = (
+        Document.objects.select_related(None)
+        .filter(vault_state='training_period')
+        .annotate(
+            total=Count('triggered_trainings'),
+            completed=Count('triggered_trainings', filter=Q(triggered_trainings__status='completed')),
+        )
+        .filter(total__gt=0, completed=F('total'))
+        .order_by()
+        .values_list('pk', 'review_period_months')
+    )
+    by_review_period = defaultdict(list)
+    for pk, months in ready:
+        by_review_period[months].append(pk)
+
+    # One UPDATE per review period, which fixes next_review_date. update()
+    # skips Document.save() and its signals; none of them act on this
+    # transition.
+    now = timezone.now()
+    today = now.date()
     transitioned = 0
-    for doc in docs_in_training:
-        try:
-            from training.models import TrainingAssignment
-            assignments = TrainingAssignment.objects.filter(triggering_document=doc)
-            total = assignments.count()
-            completed = assignments.filter(status='completed').count()
-
-            if total > 0 and completed == total:
-                doc.vault_state = 'effective'
-                doc.lifecycle_stage = 'effective'
-                doc.effective_date = timezone.now().date()
-                doc.training_completed_date = timezone.now()
-
-                if doc.review_period_months:
-                    try:
-                        from dateutil.relativedelta import relativedelta
-                        doc.next_review_date = timezone.now().date() + relativedelta(months=doc.review_period_months)
-                    except ImportError:
-                        doc.next_review_date = timezone.now().date() + timedelta(days=doc.review_period_months * 30)
-
-                doc.save()
-                transitioned += 1
-                logger.info(f"Document {doc.document_id} auto-transitioned to effective (training complete)")
-        except Exception as e:
-            logger.warning(f"Training check failed for {doc.document_id}: {e}")
+    for months, pks in by_review_period.items():
+        updates = {
+            'vault_state': 'effective',
+            'lifecycle_stage': 'effective',
+            'effective_date': today,
+            'training_completed_date': now,
+            'updated_at': now,
+        }
+        if months:
+            if relativedelta is not None:
+                updates['next_review_date'] = today + relativedelta(months=months)
+            else:
+                updates['next_review_date'] = today + timedelta(days=months * 30)
+        transitioned += Document.objects.filter(
+            pk__in=pks, vault_state='training_period'
+        ).update(**updates)
+
+    if transitioned:
+        invalidate_document_lists()
+        logger.info(f"Auto-transitioned {transitioned} documents to effective (training complete)")
 
     return f"Transitioned {transitioned} documents from training_period to effective"
 
@@ -78,7 +149,6 @@ def check_training_completion():
 @shared_task
 def send_review_reminders():
     """Send reminders for documents approaching their review date (30 days before)."""
-    from documents.models import Document
     today = timezone.now().date()
     reminder_date = today + timedelta(days=30)
 
@@ -86,53 +156,77 @@ def send_review_reminders():
         vault_state='effective',
         next_review_date__lte=reminder_date,
         next_review_date__gt=today,
-    ).select_related('owner')
-
-    count = 0
-    for doc in upcoming_reviews:
-        try:
-            from core.notifications import NotificationService
-            days_until = (doc.next_review_date - today).days
-            NotificationService.send_notification(
-                user=doc.owner,
-                title=f'Review Reminder: {doc.document_id}',
-                message=f'Document "{doc.title}" review is due in {days_until} days ({doc.next_review_date}).',
-                notification_type='review_reminder',
-                related_object=doc,
-            )
-            count += 1
-        except Exception as e:
-            logger.warning(f"Review reminder failed for {doc.document_id}: {e}")
+        owner__isnull=False,
+    ).select_related(None).select_related('owner').only(*REVIEW_NOTICE_FIELDS)
+
+    count = NotificationService.create_in_app_notifications(
+        NotificationService.build_in_app_notification(
+            recipient=doc.owner,
+            notification_type='review_reminder',
+            subject=f'Review Reminder: {doc.document_id}',
+            message=f'Document "{doc.title}" review is due in {(doc.next_review_date - today).days} days ({doc.next_review_date}).',
+            related_object_type='document',
+            related_object_id=doc.pk,
+        )
+        for doc in upcoming_reviews.iterator(chunk_size=500)
+    )
 
     return f"Sent {count} review reminders"
 
 
 @shared_task
 def escalate_overdue_approvals():
-    """Escalate approval requests that have been pending too long (>5 business days)."""
-    from documents.models import Document, DocumentApprover
+    """
+    Escalate approval requests that have been pending too long (>5 business days).
+
+    Each approver gets one notification covering all of their overdue
+    approvals, built from a single grouped query.
+    """
 
     cutoff = timezone.now() - timedelta(days=7)
 
-    stale_approvals = DocumentApprover.objects.filter(
-        approval_status='pending',
-        document__vault_state='in_review',
-        document__updated_at__lt=cutoff,
-    ).select_related('document', 'approver')
+    overdue_by_approver = (
+        DocumentApprover.objects.filter(
+            approval_status='pending',
+            document__vault_state='in_review',
+            document__updated_at__lt=cutoff,
+        )
+        .order_by()
+        .values('approver_id')
+        .annotate(
+            document_pks=ArrayAgg('document_id', order_by='document__document_id'),
+            document_ids=ArrayAgg('document__document_id', order_by='document__document_id'),
+            titles=ArrayAgg('document__title', order_by='document__document_id'),
+        )
+    )
 
     count = 0
-    for approval in stale_approvals:
-        try:
-            from core.notifications import NotificationService
-            NotificationService.send_notification(
-                user=approval.approver,
-                title=f'ESCALATION: Pending Approval for {approval.document.document_id}',
-                message=f'Your approval for "{approval.document.title}" has been pending for over 7 days. Please review.',
-                notification_type='approval_escalation',
-                related_object=approval.document,
-            )
-            count += 1
-        except Exception as e:
-            logger.warning(f"Escalation failed for approval {approval.id}: {e}")
-
-    return f"Escalated {count} overdue approvals"
+
+    def notifications():
+        nonlocal count
+        for row in overdue_by_approver.iterator(chunk_size=500):
+            count += len(row['document_ids'])
+            if len(row['document_ids']) == 1:
+                yield NotificationService.build_in_app_notification(
+                    recipient=row['approver_id'],
+                    notification_type='approval_escalation',
+                    subject=f"ESCALATION: Pending Approval for {row['document_ids'][0]}",
+                    message=f'Your approval for "{row["titles"][0]}" has been pending for over 7 days. Please review.',
+                    related_object_type='document',
+                    related_object_id=row['document_pks'][0],
+                )
+            else:
+                listing = '\n'.join(
+                    f'- {document_id}: {title}'
+                    for document_id, title in zip(row['document_ids'], row['titles'])
+                )
+                yield NotificationService.build_in_app_notification(
+                    recipient=row['approver_id'],
+                    notification_type='approval_escalation',
+                    subject=f"ESCALATION: {len(row['document_ids'])} Pending Approvals",
+                    message=f'Your approval for these documents has been pending for over 7 days. Please review.\n{listing}',
+                )
+
+    sent = NotificationService.create_in_app_notifications(notifications())
+
+    return f"Escalated {count} overdue approvals in {sent} notifications"
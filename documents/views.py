@@ -6,12 +6,16 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django_filters import FilterSet, CharFilter, DateFromToRangeFilter, BooleanFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.settings import api_settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db.models import Count, Q
-from django.db import transaction
-import threading
+from django.db.models import Count, Q, F, Prefetch
+from django.db import transaction, IntegrityError
+from django.core.cache import cache
 import hashlib
+import json
+import threading
 
 from .models import (
     DocumentInfocardType,
@@ -24,6 +28,7 @@ from .models import (
     DocumentCollaborator,
     DocumentComment,
     DocumentSuggestion,
+    user_full_name,
 )
 from .serializers import (
     DocumentInfocardTypeSerializer,
@@ -33,6 +38,7 @@ from .serializers import (
     DocumentCheckoutSerializer,
     DocumentChangeOrderSerializer,
     DocumentSnapshotSerializer,
+    DocumentSnapshotListSerializer,
     DocumentVersionSerializer,
     DocumentApproverSerializer,
     DocumentCollaboratorSerializer,
@@ -42,6 +48,7 @@ from .serializers import (
     CheckoutActionSerializer,
     CheckinActionSerializer,
     LifecycleTransitionSerializer,
+    BulkDocumentOperationSerializer,
 )
 
 
@@ -62,6 +69,8 @@ class DocumentFilterSet(FilterSet):
     requires_training = BooleanFilter(field_name='requires_training')
     is_locked = BooleanFilter(field_name='is_locked')
     requires_approval = BooleanFilter(field_name='requires_approval')
+    keyword = CharFilter(method='filter_list_contains', field_name='subject_keywords')
+    training_role = CharFilter(method='filter_list_contains', field_name='training_applicable_roles')
 
     class Meta:
         model = Document
@@ -76,8 +85,59 @@ class DocumentFilterSet(FilterSet):
             'requires_approval',
             'created_at__gte',
             'created_at__lte',
+            'keyword',
+            'training_role',
         ]
 
+    def filter_list_contains(self, queryset, name, value):
+        """Match JSON list membership with @> so the jsonb_path_ops GIN index is used."""
+        return queryset.filter(**{f'{name}__contains': [value]})
+
+
+class DocumentChangeOrderFilterSet(FilterSet):
+    """FilterSet for DocumentChangeOrder."""
+
+    status = CharFilter(field_name='status', lookup_expr='iexact')
+    affected_process = CharFilter(method='filter_affected_process')
+
+    class Meta:
+        model = DocumentChangeOrder
+        fields = ['status', 'regulatory_impact', 'training_impact', 'affected_process']
+
+    def filter_affected_process(self, queryset, name, value):
+        """Match list membership with @> so the jsonb_path_ops GIN index is used."""
+        return queryset.filter(affected_processes__contains=[value])
+
+
+class DocumentSearchFilter(SearchFilter):
+    """
+    Full-text search over Document.search_vector (title, description,
+    keywords and body text).
+
+    Identifier fields are still matched with icontains so users can search by
+    document ID; matches are annotated with ``search_rank`` for ordering.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = ' '.join(self.get_search_terms(request))
+        if not terms:
+            return queryset
+        query = SearchQuery(terms, config='english', search_type='websearch')
+        return queryset.filter(
+            Q(search_vector=query)
+            | Q(document_id__icontains=terms)
+            | Q(legacy_document_id__icontains=terms)
+        ).annotate(search_rank=SearchRank(F('search_vector'), query))
+
+
+class DocumentOrderingFilter(OrderingFilter):
+    """Order search results by relevance unless an explicit ordering is given."""
+
+    def get_default_ordering(self, view):
+        if view.request.query_params.get(api_settings.SEARCH_PARAM, '').strip():
+            return ['-search_rank', '-created_at']
+        return super().get_default_ordering(view)
+
 
 class DocumentInfocardTypeViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -87,6 +147,16 @@ class DocumentInfocardTypeViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = DocumentInfocardTypeSerializer
     permission_classes = [IsAuthenticated]
 
+    def list(self, request, *args, **kwargs):
+        """List infocard types from the versioned reference-data cache."""
+        from .lookups import get_infocard_type_list_data
+
+        data = get_infocard_type_list_data()
+        page = self.paginate_queryset(data)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(data)
+
 
 class DocumentViewSet(viewsets.ModelViewSet):
     """
@@ -103,28 +173,50 @@ class DocumentViewSet(viewsets.ModelViewSet):
     - File upload with SHA-256 hashing
     - Version auto-increment on checkin
     """
-    queryset = Document.objects.select_related(
-        'infocard_type',
-        'department',
-        'owner',
-        'locked_by',
-        'created_by',
-        'updated_by'
-    ).prefetch_related(
-        'checkouts',
-        'snapshots',
-        'versions',
-        'approvers',
-        'change_orders'
-    ).all()
+    # No reverse relations are prefetched: every action reads them through
+    # filtered or ordered queries (and the detail serializer as values()
+    # rows), which never use a prefetch cache. get_queryset() adds what
+    # individual actions read from the document row.
+    queryset = Document.detail_queryset()
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, DocumentSearchFilter, DocumentOrderingFilter]
     filterset_class = DocumentFilterSet
     search_fields = ['document_id', 'legacy_document_id', 'title', 'description', 'subject_keywords']
     ordering_fields = ['created_at', 'document_id', 'title', 'next_review_date', 'vault_state']
     ordering = ['-created_at']
     parser_classes = (JSONParser, MultiPartParser, FormParser)
 
+    def get_queryset(self):
+        """
+        List rows skip the heavy content columns. Detail reads carry approver
+        counts annotated in the same query; check-in joins the active
+        checkout it validates against.
+        """
+        if self.action == 'list':
+            return Document.list_queryset()
+        if self.action == 'retrieve':
+            # Only what the requested fieldset of DocumentDetailSerializer reads
+            wanted = DocumentDetailSerializer.field_selection(self.request)
+            queryset = Document.detail_queryset().with_detail_relations(
+                checkout=wanted('current_checkout'),
+                approval_counts=wanted('approval_status'),
+            )
+            deferred = [name for name in Document.CONTENT_FIELDS if not wanted(name)]
+            # The search vector is never rendered
+            return queryset.defer('search_vector', *deferred)
+        if self.action in ('update', 'partial_update'):
+            # What DocumentDetailSerializer reads, plus the department and
+            # owner whose names save() copies onto the row
+            return (
+                Document.detail_queryset()
+                .select_related('department', 'owner')
+                .with_detail_relations()
+            )
+        if self.action == 'checkin':
+            # get_active_checkout() answers from the joined current checkout
+            return Document.detail_queryset().with_detail_relations(approval_counts=False)
+        return super().get_queryset()
+
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action == 'list':
@@ -136,16 +228,31 @@ class DocumentViewSet(viewsets.ModelViewSet):
         return DocumentDetailSerializer
 
     def list(self, request, *args, **kwargs):
-        """Override list with error debugging."""
+        """
+        List documents from ``.values()`` rows, which DocumentListSerializer
+        renders without building model instances.
+        Pages are cached until a document changes, see lookups.
+        """
         import traceback
+        from .lookups import get_document_list_data
+
         try:
-            return super().list(request, *args, **kwargs)
+            return Response(get_document_list_data(request, self._list_data))
         except Exception as e:
             return Response(
                 {'error': str(e), 'traceback': traceback.format_exc()},
                 status=500
             )
 
+    def _list_data(self):
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *DocumentListSerializer.VALUES_FIELDS
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data).data
+        return self.get_serializer(queryset, many=True).data
+
     def retrieve(self, request, *args, **kwargs):
         """Override retrieve with error debugging."""
         import traceback
@@ -200,18 +307,6 @@ class DocumentViewSet(viewsets.ModelViewSet):
         """
         document = self.get_object()
 
-        # Validation: check if already checked out
-        active_checkout = document.get_active_checkout()
-        if active_checkout:
-            return Response(
-                {
-                    'error': 'Document is already checked out',
-                    'checked_out_by': active_checkout.checked_out_by.username,
-                    'checked_out_at': active_checkout.checked_out_at.isoformat()
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
         # Validation: only draft documents can be checked out
         if document.vault_state != 'draft':
             return Response(
@@ -224,23 +319,32 @@ class DocumentViewSet(viewsets.ModelViewSet):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            # Invalidate any previous active checkouts
-            DocumentCheckout.objects.filter(
-                document=document,
-                is_active=True
-            ).update(is_active=False)
-
-            checkout = DocumentCheckout.objects.create(
-                document=document,
-                checked_out_by=request.user,
-                checkout_reason=serializer.validated_data.get('checkout_reason', ''),
-                expected_checkin_date=serializer.validated_data.get('expected_checkin_date')
-            )
+            # The uniq_active_checkout_per_doc constraint rejects a second
+            # active checkout, so no pre-check SELECT is needed.
+            with transaction.atomic():
+                checkout = DocumentCheckout.objects.create(
+                    document=document,
+                    checked_out_by=request.user,
+                    checkout_reason=serializer.validated_data.get('checkout_reason', ''),
+                    expected_checkin_date=serializer.validated_data.get('expected_checkin_date')
+                )
 
             return Response(
                 DocumentCheckoutSerializer(checkout).data,
                 status=status.HTTP_201_CREATED
             )
+        except IntegrityError:
+            active_checkout = document.checkouts.filter(
+                is_active=True
+            ).select_related('checked_out_by').first()
+            return Response(
+                {
+                    'error': 'Document is already checked out',
+                    'checked_out_by': active_checkout.checked_out_by.username if active_checkout and active_checkout.checked_out_by else None,
+                    'checked_out_at': active_checkout.checked_out_at.isoformat() if active_checkout else None
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return Response(
                 {'error': f'Checkout failed: {str(e)}'},
@@ -283,45 +387,68 @@ class DocumentViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
 
-            # Process file upload if provided
-            if 'file' in request.FILES:
-                document.file = request.FILES['file']
-                document.original_filename = request.FILES['file'].name
-                document.file_type = request.FILES['file'].content_type
-                document.file_size = request.FILES['file'].size
-                document.file_hash = self._calculate_file_hash(request.FILES['file'])
-
-            # Auto-increment minor version
-            is_major = serializer.validated_data.get('is_major_change', False)
-            if is_major:
-                document.major_version += 1
-                document.minor_version = 0
-            else:
-                document.minor_version += 1
+            with transaction.atomic():
+                # Lock the document row so concurrent check-ins run one after
+                # another; the new version is numbered from the locked row,
+                # not from the copy get_object() read
+                current = (
+                    Document.objects.select_for_update()
+                    .select_related(None)
+                    .only('major_version', 'minor_version')
+                    .get(pk=document.pk)
+                )
+                if not DocumentCheckout.objects.filter(pk=checkout.pk, is_active=True).exists():
+                    return Response(
+                        {'error': 'Document is not currently checked out'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                document.major_version = current.major_version
+                document.minor_version = current.minor_version
+
+                update_fields = [
+                    'major_version', 'minor_version', 'change_summary', 'updated_by', 'updated_at',
+                ]
+
+                # Process file upload if provided
+                if 'file' in request.FILES:
+                    document.file = request.FILES['file']
+                    document.original_filename = request.FILES['file'].name
+                    document.file_type = request.FILES['file'].content_type
+                    document.file_size = request.FILES['file'].size
+                    document.file_hash = None  # taken from the upload stream on save()
+                    update_fields += ['file', 'original_filename', 'file_type', 'file_size', 'file_hash']
+
+                # Auto-increment minor version
+                is_major = serializer.validated_data.get('is_major_change', False)
+                if is_major:
+                    document.major_version += 1
+                    document.minor_version = 0
+                else:
+                    document.minor_version += 1
 
-            document.change_summary = serializer.validated_data.get('change_summary', '')
-            document.updated_by = request.user
-            document.save()
+                document.change_summary = serializer.validated_data.get('change_summary', '')
+                document.updated_by = request.user
+                document.save(update_fields=update_fields)
 
-            # Create version snapshot
-            version = DocumentVersion.objects.create(
-                document=document,
-                major_version=document.major_version,
-                minor_version=document.minor_version,
-                change_type='major' if is_major else 'minor',
-                is_major_change=is_major,
-                change_summary=document.change_summary,
-                snapshot_data={
-                    'title': document.title,
-                    'vault_state': document.vault_state,
-                    'version': document.version_string
-                },
-                released_date=timezone.now()
-            )
+                # Create version snapshot
+                version = DocumentVersion.objects.create(
+                    document=document,
+                    major_version=document.major_version,
+                    minor_version=document.minor_version,
+                    change_type='major' if is_major else 'minor',
+                    is_major_change=is_major,
+                    change_summary=document.change_summary,
+                    snapshot_data={
+                        'title': document.title,
+                        'vault_state': document.vault_state,
+                        'version': document.version_string
+                    },
+                    released_date=timezone.now()
+                )
 
-            # Close checkout
-            checkout.is_active = False
-            checkout.save()
+                # Close checkout
+                checkout.is_active = False
+                checkout.save(update_fields=['is_active'])
 
             return Response(
                 DocumentVersionSerializer(version).data,
@@ -390,9 +517,9 @@ class DocumentViewSet(viewsets.ModelViewSet):
         Returns paginated list of documents with overdue reviews.
         """
         today = timezone.now().date()
-        overdue = Document.objects.filter(
+        overdue = Document.list_queryset().filter(
             next_review_date__lt=today
-        ).select_related('owner', 'department').order_by('next_review_date')
+        ).order_by('next_review_date').values(*DocumentListSerializer.VALUES_FIELDS)
 
         page = self.paginate_queryset(overdue)
         if page is not None:
@@ -407,12 +534,10 @@ class DocumentViewSet(viewsets.ModelViewSet):
         """
         List documents checked out by current user.
         """
-        checkouts = DocumentCheckout.objects.filter(
-            checked_out_by=request.user,
-            is_active=True
-        ).select_related('document').order_by('-checked_out_at')
+        documents = Document.list_queryset().filter(
+            current_checkout__checked_out_by=request.user
+        ).order_by('-current_checkout__checked_out_at').values(*DocumentListSerializer.VALUES_FIELDS)
 
-        documents = [co.document for co in checkouts]
         page = self.paginate_queryset(documents)
         if page is not None:
             serializer = DocumentListSerializer(page, many=True)
@@ -436,8 +561,13 @@ class DocumentViewSet(viewsets.ModelViewSet):
             "my_documents": int
         }
         """
-        total = Document.objects.count()
         today = timezone.now().date()
+        counts = Document.objects.aggregate(
+            total=Count('id'),
+            overdue=Count('id', filter=Q(next_review_date__lt=today)),
+            locked=Count('id', filter=Q(is_locked=True)),
+            mine=Count('id', filter=Q(owner=request.user)),
+        )
 
         # Group by vault_state
         by_state = Document.objects.values('vault_state').annotate(
@@ -445,30 +575,22 @@ class DocumentViewSet(viewsets.ModelViewSet):
         ).order_by('vault_state')
 
         # Group by infocard_type
-        by_type = Document.objects.values('infocard_type__prefix').annotate(
+        by_type = Document.objects.values('infocard_prefix').annotate(
             count=Count('id')
-        ).order_by('infocard_type__prefix')
-
-        overdue = Document.objects.filter(
-            next_review_date__lt=today
-        ).count()
-
-        locked = Document.objects.filter(is_locked=True).count()
+        ).order_by('infocard_prefix')
 
         checked_out = DocumentCheckout.objects.filter(
             is_active=True
         ).count()
 
-        my_docs = Document.objects.filter(owner=request.user).count()
-
         return Response({
-            'total_documents': total,
+            'total_documents': counts['total'],
             'by_vault_state': {item['vault_state']: item['count'] for item in by_state},
-            'by_infocard_type': {item['infocard_type__prefix']: item['count'] for item in by_type},
-            'overdue_reviews': overdue,
-            'locked_documents': locked,
+            'by_infocard_type': {item['infocard_prefix']: item['count'] for item in by_type},
+            'overdue_reviews': counts['overdue'],
+            'locked_documents': counts['locked'],
             'checked_out_documents': checked_out,
-            'my_documents': my_docs,
+            'my_documents': counts['mine'],
         })
 
     @action(detail=True, methods=['post'], parser_classes=(MultiPartParser, FormParser))
@@ -480,7 +602,8 @@ class DocumentViewSet(viewsets.ModelViewSet):
             "file": "file (required)"
         }
 
-        Returns SHA-256 hash of uploaded file.
+        Returns file metadata; the SHA-256 hash is filled in asynchronously
+        and is null until the background task has run.
         """
         document = self.get_object()
 
@@ -493,15 +616,13 @@ class DocumentViewSet(viewsets.ModelViewSet):
         try:
             uploaded_file = request.FILES['file']
 
-            # Calculate SHA-256 hash
-            file_hash = self._calculate_file_hash(uploaded_file)
-
-            # Save file to document
+            # Save file to document; save() takes the SHA-256 recorded while
+            # the upload streamed in (or queues background hashing without one).
             document.file = uploaded_file
             document.original_filename = uploaded_file.name
             document.file_type = uploaded_file.content_type
             document.file_size = uploaded_file.size
-            document.file_hash = file_hash
+            document.file_hash = None
             document.save()
 
             return Response({
@@ -509,7 +630,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
                 'file_name': uploaded_file.name,
                 'file_size': uploaded_file.size,
                 'file_type': uploaded_file.content_type,
-                'file_hash': file_hash,
+                'file_hash': document.file_hash_hex or None,
                 'hash_algorithm': 'SHA-256'
             }, status=status.HTTP_200_OK)
         except Exception as e:
@@ -557,27 +678,39 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
         results = {'created': 0, 'skipped': 0, 'errors': []}
 
+        from users.models import Department
+
+        # Resolve existing legacy IDs and reference rows once, not per row
+        legacy_ids = {d.get('legacy_document_id') for d in documents_data} - {'', None}
+        existing_legacy = set(
+            Document.objects.filter(legacy_document_id__in=legacy_ids)
+            .order_by().values_list('legacy_document_id', flat=True)
+        )
+        infocard_types = {t.prefix: t for t in DocumentInfocardType.objects.all()}
+        default_type = next(iter(infocard_types.values()), None)
+        departments = {}
+
+        new_documents = []
         for doc_data in documents_data:
             try:
                 legacy_id = doc_data.get('legacy_document_id', '')
 
-                # Skip if legacy_document_id already exists
-                if legacy_id and Document.objects.filter(legacy_document_id=legacy_id).exists():
+                # Skip if legacy_document_id already exists (or repeats in this batch)
+                if legacy_id and legacy_id in existing_legacy:
                     results['skipped'] += 1
                     continue
 
                 # Look up infocard type by prefix
                 prefix = doc_data.get('infocard_type_prefix', 'SOP')
-                infocard_type = DocumentInfocardType.objects.filter(prefix=prefix).first()
-                if not infocard_type:
-                    infocard_type = DocumentInfocardType.objects.first()
+                infocard_type = infocard_types.get(prefix, default_type)
 
                 # Look up department if provided
-                from users.models import Department
                 department = None
                 dept_name = doc_data.get('department_name', '')
                 if dept_name:
-                    department = Department.objects.filter(name__icontains=dept_name).first()
+                    if dept_name not in departments:
+                        departments[dept_name] = Department.objects.filter(name__icontains=dept_name).first()
+                    department = departments[dept_name]
 
                 # Parse version from legacy ID (e.g., QA001-03 → version 3)
                 major_version = doc_data.get('major_version', 1)
@@ -602,8 +735,9 @@ class DocumentViewSet(viewsets.ModelViewSet):
                     distribution_restriction=doc_data.get('distribution_restriction', 'internal'),
                     confidentiality_level=doc_data.get('confidentiality_level', 'internal'),
                 )
-                document.save()
-                results['created'] += 1
+                new_documents.append(document)
+                if legacy_id:
+                    existing_legacy.add(legacy_id)
 
             except Exception as e:
                 results['errors'].append({
@@ -611,6 +745,12 @@ class DocumentViewSet(viewsets.ModelViewSet):
                     'error': str(e)
                 })
 
+        if new_documents:
+            try:
+                results['created'] = len(Document.objects.bulk_import(new_documents))
+            except Exception as e:
+                results['errors'].append({'legacy_id': 'batch', 'error': str(e)})
+
         return Response({
             'success': True,
             'created': results['created'],
@@ -619,12 +759,12 @@ class DocumentViewSet(viewsets.ModelViewSet):
             'total_requested': len(documents_data),
         }, status=status.HTTP_201_CREATED)
 
-    def _calculate_file_hash(self, file_obj):
-        """Calculate SHA-256 hash of a file object."""
-        hasher = hashlib.sha256()
-        for chunk in file_obj.chunks():
-            hasher.update(chunk)
-        return hasher.hexdigest()
+    def _transition_permission_cache(self):
+        """Return the per-request cache used for FSM permission checks."""
+        cache = getattr(self.request, '_transition_permission_cache', None)
+        if cache is None:
+            cache = self.request._transition_permission_cache = {}
+        return cache
 
     # ========================================================================
     # DOCUMENT STATE TRANSITION ACTIONS
@@ -650,14 +790,17 @@ class DocumentViewSet(viewsets.ModelViewSet):
         current_state = document.vault_state
 
         # FSM validation
-        from .fsm import validate_transition, check_transition_permission
+        from .fsm import validate_transition, check_transition_permission_cached
         try:
             validate_transition(current_state, target_state)
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         # Permission check
-        allowed, reason = check_transition_permission(current_state, target_state, request.user, document)
+        allowed, reason = check_transition_permission_cached(
+            current_state, target_state, request.user, document,
+            cache=self._transition_permission_cache(),
+        )
         if not allowed:
             return Response({'error': reason}, status=status.HTTP_403_FORBIDDEN)
 
@@ -668,33 +811,31 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
         try:
             old_state = document.vault_state
-            document.vault_state = target_state
-            document.lifecycle_stage = target_state
-            document.updated_by = request.user
 
             # Set state-specific dates
             now = timezone.now()
+            fields = {}
             if target_state == 'approved':
-                document.approved_date = now
+                fields['approved_date'] = now
             elif target_state == 'effective':
-                document.effective_date = now.date()
+                fields['effective_date'] = now.date()
                 if document.review_period_months:
                     try:
                         from dateutil.relativedelta import relativedelta
-                        document.next_review_date = now.date() + relativedelta(months=document.review_period_months)
+                        fields['next_review_date'] = now.date() + relativedelta(months=document.review_period_months)
                     except ImportError:
                         from datetime import timedelta
-                        document.next_review_date = now.date() + timedelta(days=document.review_period_months * 30)
+                        fields['next_review_date'] = now.date() + timedelta(days=document.review_period_months * 30)
             elif target_state == 'obsolete':
-                document.obsolete_date = now.date()
+                fields['obsolete_date'] = now.date()
             elif target_state == 'archived':
-                document.archived_date = now.date()
+                fields['archived_date'] = now.date()
             elif target_state == 'cancelled':
-                document.cancelled_date = now
-                document.cancelled_by = request.user
-                document.cancellation_reason = serializer.validated_data.get('comments', '')
+                fields['cancelled_date'] = now
+                fields['cancelled_by'] = request.user
+                fields['cancellation_reason'] = serializer.validated_data.get('comments', '')
 
-            document.save()
+            document.transition_to(target_state, user=request.user, **fields)
 
             # Create snapshot
             DocumentSnapshot.objects.create(
@@ -713,9 +854,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
             # Auto-transition: approved → training_period if training required
             if target_state == 'approved' and document.requires_training and document.training_completion_required:
-                document.vault_state = 'training_period'
-                document.lifecycle_stage = 'training_period'
-                document.save()
+                document.transition_to('training_period')
                 # Auto-assign training (signal will handle this)
 
             # Send notifications AFTER transaction commits (non-blocking)
@@ -759,17 +898,17 @@ class DocumentViewSet(viewsets.ModelViewSet):
         if document.owner != request.user and document.created_by != request.user and not request.user.is_staff:
             return Response({'error': 'Only the document owner can submit for review'}, status=status.HTTP_403_FORBIDDEN)
 
-        document.vault_state = 'in_review'
-        document.lifecycle_stage = 'in_review'
-        document.is_locked = True
-        document.locked_by = request.user
-        document.locked_at = timezone.now()
-        document.lock_reason = 'Submitted for review'
-        document.updated_by = request.user
-        document.save()
+        document.transition_to(
+            'in_review', user=request.user,
+            is_locked=True,
+            locked_by=request.user,
+            locked_at=timezone.now(),
+            lock_reason='Submitted for review',
+        )
 
         # Reset all approver statuses to pending
         document.approvers.all().update(approval_status='pending', approved_at=None, comments='')
+        Document.sync_denormalized_relations(document.pk, approvers=True)
 
         # Notify approvers AFTER transaction commits (non-blocking)
         doc_id = document.id
@@ -827,31 +966,29 @@ class DocumentViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_200_OK)
 
         # All approved — transition to approved state
-        document.vault_state = 'approved'
-        document.lifecycle_stage = 'approved'
-        document.approved_date = timezone.now()
-        document.released_date = timezone.now()
-        document.updated_by = request.user
+        target_state = 'approved'
+        fields = {
+            'approved_date': timezone.now(),
+            'released_date': timezone.now(),
+            'is_locked': True,
+        }
 
         # Auto-transition to training_period if training required
         if document.requires_training and document.training_completion_required:
-            document.vault_state = 'training_period'
-            document.lifecycle_stage = 'training_period'
+            target_state = 'training_period'
         elif not document.requires_training:
             # No training required — go directly to effective
-            document.vault_state = 'effective'
-            document.lifecycle_stage = 'effective'
-            document.effective_date = timezone.now().date()
+            target_state = 'effective'
+            fields['effective_date'] = timezone.now().date()
             if document.review_period_months:
                 try:
                     from dateutil.relativedelta import relativedelta
-                    document.next_review_date = timezone.now().date() + relativedelta(months=document.review_period_months)
+                    fields['next_review_date'] = timezone.now().date() + relativedelta(months=document.review_period_months)
                 except ImportError:
                     from datetime import timedelta
-                    document.next_review_date = timezone.now().date() + timedelta(days=document.review_period_months * 30)
+                    fields['next_review_date'] = timezone.now().date() + timedelta(days=document.review_period_months * 30)
 
-        document.is_locked = True
-        document.save()
+        document.transition_to(target_state, user=request.user, **fields)
 
         # Create approval snapshot
         DocumentSnapshot.objects.create(
@@ -868,7 +1005,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
         # Increment major version on approval
         document.major_version += 1
         document.minor_version = 0
-        document.save()
+        document.save(update_fields=['major_version', 'minor_version', 'updated_at'])
 
         # Create version record
         DocumentVersion.objects.create(
@@ -899,20 +1036,16 @@ class DocumentViewSet(viewsets.ModelViewSet):
         if not request.user.is_staff:
             return Response({'error': 'Only administrators can manually make documents effective'}, status=status.HTTP_403_FORBIDDEN)
 
-        document.vault_state = 'effective'
-        document.lifecycle_stage = 'effective'
-        document.effective_date = timezone.now().date()
-        document.updated_by = request.user
-
+        fields = {'effective_date': timezone.now().date()}
         if document.review_period_months:
             try:
                 from dateutil.relativedelta import relativedelta
-                document.next_review_date = timezone.now().date() + relativedelta(months=document.review_period_months)
+                fields['next_review_date'] = timezone.now().date() + relativedelta(months=document.review_period_months)
             except ImportError:
                 from datetime import timedelta
-                document.next_review_date = timezone.now().date() + timedelta(days=document.review_period_months * 30)
+                fields['next_review_date'] = timezone.now().date() + timedelta(days=document.review_period_months * 30)
 
-        document.save()
+        document.transition_to('effective', user=request.user, **fields)
         return Response(DocumentDetailSerializer(document).data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'])
@@ -926,13 +1059,12 @@ class DocumentViewSet(viewsets.ModelViewSet):
         if not reason:
             return Response({'error': 'Cancellation reason is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        document.vault_state = 'cancelled'
-        document.lifecycle_stage = 'cancelled'
-        document.cancelled_date = timezone.now()
-        document.cancelled_by = request.user
-        document.cancellation_reason = reason
-        document.updated_by = request.user
-        document.save()
+        document.transition_to(
+            'cancelled', user=request.user,
+            cancelled_date=timezone.now(),
+            cancelled_by=request.user,
+            cancellation_reason=reason,
+        )
 
         return Response(DocumentDetailSerializer(document).data, status=status.HTTP_200_OK)
 
@@ -946,18 +1078,15 @@ class DocumentViewSet(viewsets.ModelViewSet):
         if not request.user.is_staff:
             return Response({'error': 'Only administrators can supersede documents'}, status=status.HTTP_403_FORBIDDEN)
 
+        fields = {}
         new_doc_id = request.data.get('superseded_by_id')
         if new_doc_id:
             try:
-                new_doc = Document.objects.get(id=new_doc_id)
-                document.superseded_by = new_doc
+                fields['superseded_by'] = Document.objects.get(id=new_doc_id)
             except Document.DoesNotExist:
                 pass
 
-        document.vault_state = 'superseded'
-        document.lifecycle_stage = 'superseded'
-        document.updated_by = request.user
-        document.save()
+        document.transition_to('superseded', user=request.user, **fields)
 
         return Response(DocumentDetailSerializer(document).data, status=status.HTTP_200_OK)
 
@@ -971,11 +1100,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
         if not request.user.is_staff:
             return Response({'error': 'Only administrators can obsolete documents'}, status=status.HTTP_403_FORBIDDEN)
 
-        document.vault_state = 'obsolete'
-        document.lifecycle_stage = 'obsolete'
-        document.obsolete_date = timezone.now().date()
-        document.updated_by = request.user
-        document.save()
+        document.transition_to('obsolete', user=request.user, obsolete_date=timezone.now().date())
 
         return Response(DocumentDetailSerializer(document).data, status=status.HTTP_200_OK)
 
@@ -989,11 +1114,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
         if not request.user.is_staff:
             return Response({'error': 'Only administrators can archive documents'}, status=status.HTTP_403_FORBIDDEN)
 
-        document.vault_state = 'archived'
-        document.lifecycle_stage = 'archived'
-        document.archived_date = timezone.now().date()
-        document.updated_by = request.user
-        document.save()
+        document.transition_to('archived', user=request.user, archived_date=timezone.now().date())
 
         return Response(DocumentDetailSerializer(document).data, status=status.HTTP_200_OK)
 
@@ -1005,18 +1126,18 @@ class DocumentViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Only effective/released documents can be revised'}, status=status.HTTP_400_BAD_REQUEST)
 
         # Create a new draft version linked to this document
-        document.vault_state = 'draft'
-        document.lifecycle_stage = 'draft'
-        document.is_locked = False
-        document.locked_by = None
-        document.locked_at = None
-        document.lock_reason = ''
-        document.minor_version += 1
-        document.updated_by = request.user
-        document.save()
+        document.transition_to(
+            'draft', user=request.user,
+            is_locked=False,
+            locked_by=None,
+            locked_at=None,
+            lock_reason='',
+            minor_version=document.minor_version + 1,
+        )
 
         # Reset approvals
         document.approvers.all().update(approval_status='pending', approved_at=None, comments='')
+        Document.sync_denormalized_relations(document.pk, approvers=True)
 
         return Response(DocumentDetailSerializer(document).data, status=status.HTTP_200_OK)
 
@@ -1024,18 +1145,21 @@ class DocumentViewSet(viewsets.ModelViewSet):
     def available_transitions(self, request, pk=None):
         """Get list of available state transitions for this document."""
         document = self.get_object()
-        from .fsm import get_available_transitions, check_transition_permission
+        from .fsm import get_available_transitions, check_transition_permission_cached
 
         transitions = get_available_transitions(document.vault_state)
+        perm_cache = self._transition_permission_cache()
         # Filter by user permissions
         result = []
         for t in transitions:
-            allowed, reason = check_transition_permission(
-                document.vault_state, t['target_state'], request.user, document
+            allowed, reason = check_transition_permission_cached(
+                document.vault_state, t.target_state, request.user, document,
+                cache=perm_cache,
             )
-            t['allowed'] = allowed
-            t['reason'] = reason if not allowed else ''
-            result.append(t)
+            item = t.as_dict()
+            item['allowed'] = allowed
+            item['reason'] = reason if not allowed else ''
+            result.append(item)
 
         return Response({
             'current_state': document.vault_state,
@@ -1049,9 +1173,11 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
         try:
             from training.models import TrainingAssignment
-            assignments = TrainingAssignment.objects.filter(triggering_document=document)
-            total = assignments.count()
-            completed = assignments.filter(status='completed').count()
+            counts = TrainingAssignment.objects.filter(triggering_document=document).aggregate(
+                total=Count('id'),
+                completed=Count('id', filter=Q(status='completed')),
+            )
+            total, completed = counts['total'], counts['completed']
 
             return Response({
                 'document_id': document.document_id,
@@ -1082,13 +1208,17 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
         method = request.data.get('method', 'read')
 
-        ack, created = DocumentAcknowledgment.objects.get_or_create(
-            document=document,
-            user=request.user,
-            defaults={'method': method}
-        )
-
-        if not created:
+        # Optimistic insert: a first acknowledgment (the common case) is a
+        # single INSERT; the unique (document, user) constraint catches repeats.
+        try:
+            with transaction.atomic():
+                ack = DocumentAcknowledgment.objects.create(
+                    document=document,
+                    user=request.user,
+                    method=method,
+                )
+        except IntegrityError:
+            ack = DocumentAcknowledgment.objects.get(document=document, user=request.user)
             return Response({'message': 'Already acknowledged', 'acknowledged_at': ack.acknowledged_at}, status=status.HTTP_200_OK)
 
         return Response({
@@ -1165,7 +1295,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
             document.locked_by = request.user
             document.locked_at = timezone.now()
             document.lock_reason = request.data.get('reason', '')
-            document.save()
+            document.save(update_fields=[*Document.LOCK_FIELDS, 'updated_at'])
 
             return Response(
                 DocumentDetailSerializer(document).data,
@@ -1194,7 +1324,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
             document.locked_by = None
             document.locked_at = None
             document.lock_reason = ''
-            document.save()
+            document.save(update_fields=[*Document.LOCK_FIELDS, 'updated_at'])
 
             return Response(
                 DocumentDetailSerializer(document).data,
@@ -1206,25 +1336,168 @@ class DocumentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Lock, unlock or approve several documents in one request.
+
+        POST body: [
+            {"id": 1, "op": "lock", "payload": {"reason": "string (optional)"}},
+            {"id": 2, "op": "unlock"},
+            {"id": 3, "op": "approve", "payload": {"signature": "string (required)", "comment": "string (optional)"}}
+        ]
+
+        Items are applied in order and follow the rules of the lock, unlock
+        and approve actions. Nothing is written unless every item is valid;
+        the documents and approver records are then saved with one
+        bulk_update each, in a single transaction.
+        """
+        serializer = BulkDocumentOperationSerializer(
+            data=request.data, many=True, allow_empty=False, max_length=500
+        )
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        items = serializer.validated_data
+
+        from core.signals import audit_values, log_bulk_update
+        from .lookups import invalidate_document_lists
+
+        documents = (
+            Document.objects.select_related(None)
+            .select_related('locked_by')
+            .only('id', 'document_id', 'title', 'major_version', 'minor_version', *Document.LOCK_FIELDS)
+            .order_by()
+            .in_bulk({item['id'] for item in items})
+        )
+        approvers = {
+            approver.document_id: approver
+            for approver in DocumentApprover.objects.filter(
+                document_id__in={item['id'] for item in items if item['op'] == 'approve'},
+                approver=request.user,
+            )
+        }
+
+        now = timezone.now()
+        locked, approved, errors = {}, {}, []
+        counts = dict.fromkeys(BulkDocumentOperationSerializer.OPERATIONS, 0)
+        for index, item in enumerate(items):
+            document = documents.get(item['id'])
+            op, payload = item['op'], item['payload']
+            if document is None:
+                errors.append({'index': index, 'id': item['id'], 'error': 'Document not found'})
+                continue
+
+            if op == 'approve':
+                approver = approvers.get(document.pk)
+                if approver is None:
+                    errors.append({'index': index, 'id': item['id'], 'error': 'You are not an approver of this document'})
+                    continue
+                approver.approval_status = 'approved'
+                approver.approved_at = now
+                approver.comments = payload.get('comment', '')
+                approved[document.pk] = approver
+            else:
+                # Only document owner or staff can unlock
+                if op == 'unlock' and document.locked_by_id != request.user.pk and not request.user.is_staff:
+                    errors.append({'index': index, 'id': item['id'], 'error': 'Only the user who locked this document can unlock it'})
+                    continue
+                if document.pk not in locked:
+                    document._old_values = audit_values(document, Document.LOCK_FIELDS)
+                    locked[document.pk] = document
+                if op == 'lock':
+                    document.is_locked = True
+                    document.locked_by = request.user
+                    document.locked_at = now
+                    document.lock_reason = payload.get('reason', '')
+                else:
+                    document.is_locked = False
+                    document.locked_by = None
+                    document.locked_at = None
+                    document.lock_reason = ''
+            counts[op] += 1
+
+        if errors:
+            return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                if locked:
+                    for document in locked.values():
+                        document.updated_at = now
+                    Document.objects.bulk_update(locked.values(), [*Document.LOCK_FIELDS, 'updated_at'])
+                    log_bulk_update(Document, locked.values(), Document.LOCK_FIELDS)
+                    transaction.on_commit(invalidate_document_lists)
+                if approved:
+                    DocumentApprover.objects.bulk_update(
+                        approved.values(), ['approval_status', 'approved_at', 'comments']
+                    )
+                    Document.sync_denormalized_relations(list(approved), approvers=True)
+        except Exception as e:
+            return Response(
+                {'error': f'Bulk action failed: {str(e)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if approved:
+            # Send notifications AFTER transaction commits (non-blocking)
+            _doc_ids = list(approved)
+            _uid = request.user.id
+
+            def _notify_approvals():
+                try:
+                    from core.notifications import NotificationService
+                    from django.contrib.auth import get_user_model
+                    User = get_user_model()
+                    _user = User.objects.get(id=_uid)
+                    for _doc in Document.objects.filter(id__in=_doc_ids):
+                        NotificationService.send_approval_complete(
+                            document=_doc, approver=_user, decision='approved',
+                        )
+                except Exception:
+                    pass
+
+            transaction.on_commit(lambda: threading.Thread(target=_notify_approvals, daemon=True).start())
+
+        return Response(
+            {
+                'success': True,
+                'locked': counts['lock'],
+                'unlocked': counts['unlock'],
+                'approved': counts['approve'],
+                'total_requested': len(items),
+            },
+            status=status.HTTP_200_OK
+        )
+
     # ========================================================================
     # DOCUMENT METADATA RETRIEVAL ACTIONS
     # ========================================================================
 
     @action(detail=True, methods=['get'])
     def snapshots(self, request, pk=None):
-        """List all snapshots for a document."""
+        """List all snapshots for a document (without their frozen payloads)."""
         document = self.get_object()
-        snapshots = document.snapshots.all().order_by('-created_at')
-        serializer = DocumentSnapshotSerializer(snapshots, many=True)
+        snapshots = document.snapshots.order_by('-created_at')
+        serializer = DocumentSnapshotListSerializer(snapshots, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['get'], url_path='snapshots/(?P<snapshot_id>[0-9]+)')
+    def snapshot_detail(self, request, pk=None, snapshot_id=None):
+        """Return one snapshot including its frozen document state."""
+        document = self.get_object()
+        try:
+            snapshot = document.snapshots.select_related('snapshot_blob').get(id=snapshot_id)
+        except DocumentSnapshot.DoesNotExist:
+            return Response({'error': 'Snapshot not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(DocumentSnapshotSerializer(snapshot).data)
+
     @action(detail=True, methods=['get', 'post'])
     def approvers(self, request, pk=None):
         """List or add approvers for a document."""
         document = self.get_object()
 
         if request.method == 'GET':
-            approvers = document.approvers.all().order_by('sequence')
+            approvers = document.approvers.select_related('approver').order_by('sequence')
             serializer = DocumentApproverSerializer(approvers, many=True)
             return Response(serializer.data)
 
@@ -1234,35 +1507,56 @@ class DocumentViewSet(viewsets.ModelViewSet):
         if not isinstance(approvers_data, list):
             approvers_data = [approvers_data]
 
-        results = []
+        requested = []
         for appr in approvers_data:
             user_id = appr.get('user_id') if isinstance(appr, dict) else appr
             role_label = appr.get('role', 'Reviewer') if isinstance(appr, dict) else 'Reviewer'
             seq = appr.get('sequence', 1) if isinstance(appr, dict) else 1
+            requested.append((user_id, role_label, seq))
 
-            try:
-                user = AuthUser.objects.get(id=user_id)
-                obj, created = DocumentApprover.objects.update_or_create(
-                    document=document,
-                    approver=user,
-                    defaults={
-                        'sequence': seq,
-                        'role_required': role_label,
-                        'approval_status': 'pending'
-                    }
-                )
-                results.append({
-                    'id': obj.id,
-                    'user_id': user.id,
-                    'username': user.username,
-                    'full_name': user.get_full_name(),
-                    'role': role_label,
-                    'sequence': seq,
-                    'status': obj.approval_status,
-                    'created': created
-                })
-            except AuthUser.DoesNotExist:
+        users = AuthUser.objects.in_bulk(
+            [user_id for user_id, _, _ in requested if str(user_id).isdigit()]
+        )
+        existing = set(document.approvers.values_list('approver_id', flat=True))
+
+        results = []
+        rows = {}
+        for user_id, role_label, seq in requested:
+            user = users.get(int(user_id)) if str(user_id).isdigit() else None
+            if user is None:
                 results.append({'user_id': user_id, 'error': 'User not found'})
+                continue
+            rows[user.id] = DocumentApprover(
+                document=document,
+                approver=user,
+                sequence=seq,
+                role_required=role_label,
+                approval_status='pending',
+            )
+            results.append({
+                'user_id': user.id,
+                'username': user.username,
+                'full_name': user.get_full_name(),
+                'role': role_label,
+                'sequence': seq,
+                'status': 'pending',
+                'created': user.id not in existing,
+            })
+
+        if rows:
+            # One upsert on (document, approver) instead of update_or_create per row
+            saved = DocumentApprover.objects.bulk_create(
+                list(rows.values()),
+                update_conflicts=True,
+                unique_fields=['document', 'approver'],
+                update_fields=['sequence', 'role_required', 'approval_status'],
+            )
+            ids = {obj.approver_id: obj.id for obj in saved}
+            for result in results:
+                if 'error' not in result:
+                    result['id'] = ids[result['user_id']]
+            # bulk_create skips the post_save receiver that maintains this
+            Document.sync_denormalized_relations(document.pk, approvers=True)
 
         return Response({'approvers': results}, status=status.HTTP_201_CREATED)
 
@@ -1283,9 +1577,9 @@ class DocumentViewSet(viewsets.ModelViewSet):
         document = self.get_object()
 
         if request.method == 'GET':
-            collabs = DocumentCollaborator.objects.filter(
+            collabs = DocumentCollaborator.objects.with_user_details().filter(
                 document=document
-            ).exclude(status='removed').select_related('user', 'user__profile', 'user__profile__department')
+            ).exclude(status='removed')
             serializer = DocumentCollaboratorSerializer(collabs, many=True)
             return Response(serializer.data)
 
@@ -1319,6 +1613,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
             }
         )
 
+        collab = DocumentCollaborator.objects.with_user_details().get(pk=collab.pk)
         serializer = DocumentCollaboratorSerializer(collab)
         return Response(serializer.data, status=201 if created else 200)
 
@@ -1345,6 +1640,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
             collab.status = status_val
 
         collab.save()
+        collab = DocumentCollaborator.objects.with_user_details().get(pk=collab.pk)
         serializer = DocumentCollaboratorSerializer(collab)
         return Response(serializer.data)
 
@@ -1380,10 +1676,17 @@ class DocumentViewSet(viewsets.ModelViewSet):
         """Return audit log entries for this document."""
         document = self.get_object()
 
-        # Collect all document changes from audit trail
-        checkouts = DocumentCheckout.objects.filter(document=document).order_by('-checked_out_at')
-        versions = DocumentVersion.objects.filter(document=document).order_by('-created_at')
-        approvals = DocumentApprover.objects.filter(document=document).order_by('-approved_at')
+        # Collect all document changes from audit trail, joining the user
+        # each entry names (the document's created_by is joined already)
+        checkouts = DocumentCheckout.objects.filter(document=document).select_related(
+            'checked_out_by'
+        ).order_by('-checked_out_at')
+        versions = DocumentVersion.objects.filter(document=document).select_related(
+            'created_by'
+        ).order_by('-created_at')
+        approvals = DocumentApprover.objects.filter(
+            document=document, approved_at__isnull=False
+        ).select_related('approver').order_by('-approved_at')
 
         # Build timeline
         timeline = []
@@ -1416,13 +1719,12 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
         # Approvals
         for approval in approvals:
-            if approval.approved_at:
-                timeline.append({
-                    'timestamp': approval.approved_at,
-                    'action': 'approved',
-                    'user': approval.approver.username if approval.approver else 'Unknown',
-                    'details': f'Status: {approval.approval_status} - {approval.comments}'
-                })
+            timeline.append({
+                'timestamp': approval.approved_at,
+                'action': 'approved',
+                'user': approval.approver.username if approval.approver else 'Unknown',
+                'details': f'Status: {approval.approval_status} - {approval.comments}'
+            })
 
         # Sort by timestamp
         timeline.sort(key=lambda x: x['timestamp'], reverse=True)
@@ -1524,9 +1826,25 @@ class DocumentViewSet(viewsets.ModelViewSet):
         document = self.get_object()
 
         if request.method == 'GET':
+            # Counts and replies travel with the threads, so the serializer
+            # issues no query per comment
             qs = DocumentComment.objects.filter(
                 document=document, parent__isnull=True
-            ).select_related('author', 'resolved_by').prefetch_related('replies__author')
+            ).select_related('author', 'resolved_by').annotate(
+                reply_count=Count('replies'),
+                author_name=user_full_name('author'),
+            ).prefetch_related(
+                Prefetch(
+                    'replies',
+                    queryset=DocumentComment.objects.select_related(
+                        'author', 'resolved_by'
+                    ).annotate(
+                        reply_count=Count('replies'),
+                        author_name=user_full_name('author'),
+                    ).order_by('created_at'),
+                    to_attr='thread_replies',
+                )
+            )
 
             status_filter = request.query_params.get('status')
             if status_filter:
@@ -1581,7 +1899,9 @@ class DocumentViewSet(viewsets.ModelViewSet):
         if request.method == 'GET':
             qs = DocumentSuggestion.objects.filter(
                 document=document
-            ).select_related('author', 'reviewed_by')
+            ).select_related('author', 'reviewed_by').annotate(
+                author_name=user_full_name('author'),
+            )
 
             status_filter = request.query_params.get('status')
             if status_filter:
@@ -1673,7 +1993,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
         if fmt == 'docx':
             try:
-                return self._export_docx(document, html_content)
+                return self._cached_export(document, fmt, html_content, self._export_docx)
             except ImportError as e:
                 return Response(
                     {'error': f'Missing dependency: {e}. Contact admin.'},
@@ -1687,7 +2007,7 @@ class DocumentViewSet(viewsets.ModelViewSet):
 
         if fmt == 'pdf':
             try:
-                return self._export_pdf(document, html_content)
+                return self._cached_export(document, fmt, html_content, self._export_pdf)
             except ImportError as e:
                 return Response(
                     {'error': f'Missing dependency: {e}. Contact admin.'},
@@ -1699,6 +2019,40 @@ class DocumentViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
 
+    EXPORT_CACHE_TTL = 60 * 60 * 24
+    EXPORT_CONTENT_TYPES = {
+        'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        'pdf': 'application/pdf',
+    }
+
+    def _cached_export(self, document, fmt, html_content, render):
+        """
+        Return a rendered DOCX/PDF export, reusing a cached rendering if the
+        inputs are unchanged.
+
+        The key is a BLAKE2b digest of everything the renderers read (HTML
+        body plus the title/ID/version/state header), so any edit produces a
+        new key and no explicit invalidation is needed. BLAKE2b is used for
+        speed; the key is not security-sensitive.
+        """
+        from django.http import HttpResponse
+
+        inputs = json.dumps([
+            fmt, html_content, document.title, document.document_id,
+            document.version_string, document.vault_state,
+        ])
+        key = f'doc_export:{fmt}:' + hashlib.blake2b(inputs.encode(), digest_size=16).hexdigest()
+
+        body = cache.get(key)
+        if body is None:
+            response = render(document, html_content)
+            cache.set(key, response.content, self.EXPORT_CACHE_TTL)
+            return response
+
+        response = HttpResponse(body, content_type=self.EXPORT_CONTENT_TYPES[fmt])
+        response['Content-Disposition'] = f'attachment; filename="{document.document_id}.{fmt}"'
+        return response
+
     def _wrap_html_for_export(self, document, html_content):
         """Wrap raw HTML content in a full styled HTML document for export."""
         return f"""<!DOCTYPE html>
@@ -2150,15 +2504,13 @@ class DocumentChangeOrderViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing document change orders with approval workflows.
     """
-    queryset = DocumentChangeOrder.objects.select_related(
-        'document',
-        'proposed_by'
-    ).prefetch_related(
-        'approvals'
-    ).all()
+    # DocumentChangeOrderSerializer renders document and proposed_by as
+    # primary keys and no approvals, so nothing is joined or prefetched
+    queryset = DocumentChangeOrder.objects.all()
     serializer_class = DocumentChangeOrderSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filterset_class = DocumentChangeOrderFilterSet
     search_fields = ['document__document_id', 'change_number', 'description', 'title']
     ordering_fields = ['created_at', 'status', 'change_number']
     ordering = ['-created_at']